@@ -38,25 +38,99 @@ logger = get_logger(__name__)
 # Localization directory
 LOCALE_DIR = Path(__file__).parent.parent.parent / "locales"
 
+# Native language names
+_LANGUAGE_NAMES = {
+    "en": "English",
+    "es": "Español",
+    "fr": "Français",
+    "de": "Deutsch",
+    "zh": "中文",
+    "ja": "日本語",
+    "pt": "Português",
+    "it": "Italiano",
+    "ru": "Русский",
+    "ko": "한국어",
+    "ar": "العربية",
+    "hi": "हिन्दी",
+    "te": "తెలుగు",
+    "ta": "தமிழ்",
+    "ro": "Română"
+}
+
 # Current language and translation function
 _current_lang: str = "en"
 _translations: Optional[gettext.GNUTranslations] = None
-_translation_function: Callable[[str], str] = lambda x: x
 
 
+def _initialize(message: str) -> str:
+    """
+    Load the system language on first use, then translate the message.
+    
+    Installed as the initial translation function so that importing this
+    module does no locale or filesystem I/O. ``set_language`` replaces it,
+    so the check is paid only once.
+    """
+    _ensure_initialized()
+    return _translation_function(message)
+
+
+_translation_function: Callable[[str], str] = _initialize
+
+
+def _(message: str) -> str:
+    """
+    Translate a message to the current language.
+    
+    This is the main translation function used throughout the CLI.
+    
+    Args:
+        message: English message to translate
+        
+    Returns:
+        Translated message in current language
+    """
+    return _translation_function(message)
+
+
+def _ensure_initialized() -> None:
+    """Initialize with the system language if no language has been set yet."""
+    if _translation_function is not _initialize:
+        return
+    
+    try:
+        set_language(get_system_language())
+    except Exception as e:
+        logger.debug(f"Failed to initialize language: {e}")
+        set_language("en")
+
+
+@lru_cache(maxsize=1)
 def get_system_language() -> str:
     """
     Detect system default language.
     
+    Checks the standard gettext environment variables first (LANGUAGE,
+    LC_ALL, LC_MESSAGES, LANG) and only falls back to the locale module
+    when none of them are set. The result is cached since the system
+    language does not change during a run.
+    
     Returns:
         Two-letter language code (e.g., 'en', 'es', 'fr')
     """
     try:
-        # Get system locale
-        system_locale = locale.getdefaultlocale()[0]
+        system_locale = (
+            # LANGUAGE is a colon-separated preference list (e.g. 'es:en')
+            os.environ.get("LANGUAGE", "").partition(":")[0]
+            or os.environ.get("LC_ALL")
+            or os.environ.get("LC_MESSAGES")
+            or os.environ.get("LANG")
+            or locale.getlocale()[0]
+        )
         if system_locale:
-            # Extract language code (e.g., 'en_US' -> 'en')
-            lang_code = system_locale.split('_')[0].lower()
+            # Map platform names to POSIX form (e.g., Windows 'Spanish_Spain' -> 'es_ES.ISO8859-1')
+            system_locale = locale.normalize(system_locale)
+            # Extract language code (e.g., 'en_US.UTF-8' -> 'en')
+            lang_code = system_locale.partition('.')[0].partition('_')[0].lower()
             if lang_code in get_available_languages():
                 return lang_code
     except Exception as e:
@@ -75,10 +149,13 @@ def get_available_languages() -> List[str]:
     """
     languages = ["en"]  # English always available
     
-    if LOCALE_DIR.exists():
-        for item in LOCALE_DIR.iterdir():
-            if item.is_dir() and (item / "LC_MESSAGES" / "rocket.mo").exists():
-                languages.append(item.name)
+    if os.path.isdir(LOCALE_DIR):
+        with os.scandir(LOCALE_DIR) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.isfile(
+                    os.path.join(entry.path, "LC_MESSAGES", "rocket.mo")
+                ):
+                    languages.append(entry.name)
     
     return sorted(languages)
 
@@ -102,9 +179,10 @@ def set_language(lang_code: str) -> bool:
     
     try:
         if lang_code == "en":
-            # English - no translation needed
+            # English - no translation needed. str() returns an existing
+            # str unchanged, so this is an identity call without a Python frame.
             _translations = None
-            _translation_function = lambda x: x
+            _translation_function = str
         else:
             # Load translation file
             _translations = gettext.translation(
@@ -123,7 +201,7 @@ def set_language(lang_code: str) -> bool:
         logger.error(f"Failed to load language '{lang_code}': {e}")
         # Fallback to English
         _translations = None
-        _translation_function = lambda x: x
+        _translation_function = str
         _current_lang = "en"
         return False
 
@@ -135,24 +213,10 @@ def get_current_language() -> str:
     Returns:
         Two-letter language code
     """
+    _ensure_initialized()
     return _current_lang
 
 
-def _(message: str) -> str:
-    """
-    Translate a message to the current language.
-    
-    This is the main translation function used throughout the CLI.
-    
-    Args:
-        message: English message to translate
-        
-    Returns:
-        Translated message in current language
-    """
-    return _translation_function(message)
-
-
 # Translation wrapper with formatting support
 def translate(message: str, **kwargs) -> str:
     """
@@ -169,7 +233,7 @@ def translate(message: str, **kwargs) -> str:
         translate("Hello, {name}!", name="Alice")
         # Spanish: "¡Hola, Alice!"
     """
-    translated = _(message)
+    translated = _translation_function(message)
     if kwargs:
         try:
             return translated.format(**kwargs)
@@ -189,30 +253,4 @@ def get_language_name(lang_code: str) -> str:
     Returns:
         Native language name
     """
-    language_names = {
-        "en": "English",
-        "es": "Español",
-        "fr": "Français",
-        "de": "Deutsch",
-        "zh": "中文",
-        "ja": "日本語",
-        "pt": "Português",
-        "it": "Italiano",
-        "ru": "Русский",
-        "ko": "한국어",
-        "ar": "العربية",
-        "hi": "हिन्दी",
-        "te": "తెలుగు",
-        "ta": "தமிழ்",
-        "ro": "Română"
-    }
-    return language_names.get(lang_code, lang_code.upper())
-
-
-# Initialize with system language on import
-try:
-    system_lang = get_system_language()
-    set_language(system_lang)
-except Exception as e:
-    logger.debug(f"Failed to initialize language: {e}")
-    set_language("en")
+    return _LANGUAGE_NAMES.get(lang_code, lang_code.upper())
@@ -22,20 +22,85 @@ Usage:
     )
 """
 
+import array
+import atexit
+import functools
 import json
+import platform
+import queue
+import sys
+import threading
 import time
+import weakref
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Callable, Any, TYPE_CHECKING
+from dataclasses import dataclass, asdict, field
 from collections import deque
+from itertools import islice
 
 from Rocket.Utils.Log import get_logger
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Use orjson for history records when it is installed
+try:
+    import orjson
+    
+    def _encode_record(data: Dict) -> bytes:
+        """Serialize a history record as compact JSON."""
+        # Match stdlib json: accept non-str metadata keys
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str)
+    
+    _decode_record = orjson.loads
+except ImportError:
+    def _encode_record(data: Dict) -> bytes:
+        """Serialize a history record as compact JSON."""
+        return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+    
+    _decode_record = json.loads
+
 logger = get_logger(__name__)
 
 
+def _encode_records(notifications: Iterable["Notification"]) -> bytes:
+    """
+    Serialize notifications as JSON Lines.
+    
+    A record that cannot be encoded is logged and skipped so it does not
+    cost the rest of the batch.
+    """
+    lines = []
+    for notification in notifications:
+        try:
+            lines.append(_encode_record(notification.to_dict()))
+        except Exception as e:
+            logger.error(f"Skipping notification '{notification.title}' in history: {e}")
+    return b"".join(line + b"\n" for line in lines)
+
+# Use __slots__ for dataclasses where supported (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Operating system name, used to pick the desktop notification backend
+_PLATFORM = platform.system()
+
+# Shared Rich console, created on first console delivery
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    
+    return _console
+
+
 class NotificationLevel(Enum):
     """Notification priority levels."""
     DEBUG = "debug"
@@ -47,30 +112,43 @@ class NotificationLevel(Enum):
     
     def to_color(self) -> str:
         """Get Rich color for this level."""
-        colors = {
-            NotificationLevel.DEBUG: "dim",
-            NotificationLevel.INFO: "cyan",
-            NotificationLevel.SUCCESS: "green",
-            NotificationLevel.WARNING: "yellow",
-            NotificationLevel.ERROR: "red",
-            NotificationLevel.CRITICAL: "bold red"
-        }
-        return colors.get(self, "white")
+        return _LEVEL_COLOR.get(self, "white")
     
     def to_icon(self) -> str:
         """Get emoji icon for this level."""
-        icons = {
-            NotificationLevel.DEBUG: "🔍",
-            NotificationLevel.INFO: "ℹ️",
-            NotificationLevel.SUCCESS: "✅",
-            NotificationLevel.WARNING: "⚠️",
-            NotificationLevel.ERROR: "❌",
-            NotificationLevel.CRITICAL: "🚨"
-        }
-        return icons.get(self, "📢")
+        return _LEVEL_ICON.get(self, "📢")
+
+
+# Per-level lookup tables, built once at import
+_LEVEL_COLOR: Dict[NotificationLevel, str] = {
+    NotificationLevel.DEBUG: "dim",
+    NotificationLevel.INFO: "cyan",
+    NotificationLevel.SUCCESS: "green",
+    NotificationLevel.WARNING: "yellow",
+    NotificationLevel.ERROR: "red",
+    NotificationLevel.CRITICAL: "bold red"
+}
+
+_LEVEL_ICON: Dict[NotificationLevel, str] = {
+    NotificationLevel.DEBUG: "🔍",
+    NotificationLevel.INFO: "ℹ️",
+    NotificationLevel.SUCCESS: "✅",
+    NotificationLevel.WARNING: "⚠️",
+    NotificationLevel.ERROR: "❌",
+    NotificationLevel.CRITICAL: "🚨"
+}
 
+_LEVEL_PRIORITY: Dict[NotificationLevel, int] = {
+    NotificationLevel.DEBUG: 0,
+    NotificationLevel.INFO: 1,
+    NotificationLevel.SUCCESS: 2,
+    NotificationLevel.WARNING: 3,
+    NotificationLevel.ERROR: 4,
+    NotificationLevel.CRITICAL: 5
+}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Notification:
     """Represents a single notification."""
     title: str
@@ -80,9 +158,16 @@ class Notification:
     category: str = "general"
     metadata: Dict[str, Any] = None
     
+    # Rendered forms, computed once per notification
+    _console_text: str = field(default="", init=False, repr=False, compare=False)
+    _time_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
+        
+        color = self.level.to_color()
+        self._console_text = f"{self.level.to_icon()} [{color}]{self.title}[/{color}]: {self.message}"
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -103,13 +188,14 @@ class Notification:
     
     def formatted_time(self) -> str:
         """Get human-readable timestamp."""
-        dt = datetime.fromtimestamp(self.timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        if self._time_text is None:
+            dt = datetime.fromtimestamp(self.timestamp)
+            self._time_text = dt.strftime("%Y-%m-%d %H:%M:%S")
+        return self._time_text
     
     def format_console(self) -> str:
         """Format notification for console display."""
-        icon = self.level.to_icon()
-        return f"{icon} [{self.level.to_color()}]{self.title}[/{self.level.to_color()}]: {self.message}"
+        return self._console_text
 
 
 class NotificationChannel(Enum):
@@ -121,7 +207,7 @@ class NotificationChannel(Enum):
     EMAIL = "email"              # Send via email (requires SMTP config)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NotificationConfig:
     """Notification system configuration."""
     enabled: bool = True
@@ -130,6 +216,7 @@ class NotificationConfig:
     max_history: int = 1000
     rate_limit_seconds: int = 60
     rate_limit_count: int = 10
+    persist: bool = True
     
     def __post_init__(self):
         if self.channels is None:
@@ -141,8 +228,15 @@ class NotificationManager:
     Manages notifications across multiple channels.
     
     Handles notification delivery, filtering, history, and rate limiting.
+    Channel delivery and history persistence run on a background worker
+    thread that processes queued notifications in batches.
     """
     
+    # Maximum notifications processed per worker wake-up
+    BATCH_SIZE = 64
+    # History file name used before history moved to JSON Lines
+    LEGACY_HISTORY_NAME = "notifications.json"
+    
     def __init__(
         self,
         config: Optional[NotificationConfig] = None,
@@ -153,20 +247,37 @@ class NotificationManager:
         
         Args:
             config: Notification configuration
-            history_file: Path to notification history file
+            history_file: Path to notification history file (JSON Lines)
         """
         self.config = config or NotificationConfig()
-        self.history_file = history_file or (Path.home() / ".rocket-cli" / "notifications.json")
+        self.history_file = history_file or (Path.home() / ".rocket-cli" / "notifications.jsonl")
         
         self._history: deque[Notification] = deque(maxlen=self.config.max_history)
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._rate_limiter: deque[float] = deque(maxlen=self.config.rate_limit_count)
+        # Subscribers per category, stored as insertion-ordered dict keys so
+        # unsubscribing is a single hash lookup
+        self._subscribers: Dict[str, Dict[Callable, None]] = {}
+        self._global_subscribers = self._subscribers.setdefault("*", {})
+        # Send times of the last rate_limit_count notifications; the slot at
+        # _rate_index always holds the oldest one
+        self._rate_ring = array.array('d', [float('-inf')] * max(self.config.rate_limit_count, 0))
+        self._rate_index = 0
+        self._history_fp = None
+        self._log_fp = None
+        self._io_lock = threading.Lock()
+        self._worker_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Notification]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
         
         # Create directory if needed
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Load history
         self.load_history()
+        
+        # Drain the queue and flush history on interpreter exit. The hook
+        # holds only a weak reference so unused managers can still be freed.
+        self._atexit_hook = functools.partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._atexit_hook)
     
     def send_notification(
         self,
@@ -193,16 +304,7 @@ class NotificationManager:
             return False
         
         # Check minimum level
-        level_priority = {
-            NotificationLevel.DEBUG: 0,
-            NotificationLevel.INFO: 1,
-            NotificationLevel.SUCCESS: 2,
-            NotificationLevel.WARNING: 3,
-            NotificationLevel.ERROR: 4,
-            NotificationLevel.CRITICAL: 5
-        }
-        
-        if level_priority[level] < level_priority[self.config.min_level]:
+        if _LEVEL_PRIORITY[level] < _LEVEL_PRIORITY[self.config.min_level]:
             return False
         
         # Check rate limiting
@@ -223,17 +325,76 @@ class NotificationManager:
         # Add to history
         self._history.append(notification)
         
-        # Deliver to channels
-        self._deliver(notification)
-        
         # Notify subscribers
         self._notify_subscribers(notification)
         
-        # Save history
-        self.save_history()
+        # Console output stays synchronous so it keeps its place relative
+        # to whatever the caller prints next
+        if NotificationChannel.CONSOLE in self.config.channels:
+            try:
+                self._deliver_console([notification])
+            except Exception as e:
+                logger.error(f"Failed to deliver notification to console: {e}")
+        
+        # Hand file, desktop, webhook and history I/O to the worker thread
+        self._ensure_worker()
+        self._queue.put(notification)
         
         return True
     
+    def _ensure_worker(self) -> None:
+        """Start the background delivery worker if it is not running."""
+        if self._worker is not None:
+            return
+        
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker,
+                    name="rocket-notifications",
+                    daemon=True
+                )
+                self._worker.start()
+    
+    def _run_worker(self) -> None:
+        """
+        Process queued notifications in batches until stopped.
+        
+        Blocks for the first item, then drains whatever else is queued (up
+        to BATCH_SIZE) so bursts are delivered and persisted together. A
+        None item stops the worker.
+        """
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            notifications = [n for n in batch if n is not None]
+            try:
+                if notifications:
+                    self._deliver(notifications)
+                    self._append_history(notifications)
+            except Exception as e:
+                logger.error(f"Notification worker failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if len(notifications) < len(batch):
+                return
+    
+    def flush(self) -> None:
+        """Wait until all queued notifications are delivered and written."""
+        if self._worker is not None:
+            self._queue.join()
+        
+        with self._io_lock:
+            if self._history_fp is not None:
+                self._history_fp.flush()
+    
     def _check_rate_limit(self) -> bool:
         """
         Check if rate limit allows sending notification.
@@ -241,64 +402,74 @@ class NotificationManager:
         Returns:
             True if within rate limit
         """
-        current_time = time.time()
+        if not self._rate_ring:
+            return False
         
-        # Remove old entries outside the rate limit window
-        cutoff_time = current_time - self.config.rate_limit_seconds
-        while self._rate_limiter and self._rate_limiter[0] < cutoff_time:
-            self._rate_limiter.popleft()
+        current_time = time.monotonic()
         
-        # Check if we're at the limit
-        if len(self._rate_limiter) >= self.config.rate_limit_count:
+        # At the limit if the oldest of the last N sends is inside the window
+        if current_time - self._rate_ring[self._rate_index] < self.config.rate_limit_seconds:
             return False
         
-        # Add current timestamp
-        self._rate_limiter.append(current_time)
+        # Record this send over the oldest slot
+        self._rate_ring[self._rate_index] = current_time
+        self._rate_index = (self._rate_index + 1) % len(self._rate_ring)
         return True
     
-    def _deliver(self, notification: Notification) -> None:
+    def _deliver(self, notifications: List[Notification]) -> None:
         """
-        Deliver notification to all configured channels.
+        Deliver a batch of notifications to the configured background
+        channels. Console output is handled in send_notification.
         
         Args:
-            notification: Notification to deliver
+            notifications: Notifications to deliver, oldest first
         """
         for channel in self.config.channels:
             try:
                 if channel == NotificationChannel.CONSOLE:
-                    self._deliver_console(notification)
-                elif channel == NotificationChannel.FILE:
-                    self._deliver_file(notification)
-                elif channel == NotificationChannel.DESKTOP:
-                    self._deliver_desktop(notification)
-                elif channel == NotificationChannel.WEBHOOK:
-                    self._deliver_webhook(notification)
+                    continue
+                
+                if channel == NotificationChannel.FILE:
+                    self._deliver_file(notifications)
+                    continue
+                
+                for notification in notifications:
+                    if channel == NotificationChannel.DESKTOP:
+                        self._deliver_desktop(notification)
+                    elif channel == NotificationChannel.WEBHOOK:
+                        self._deliver_webhook(notification)
             except Exception as e:
                 logger.error(f"Failed to deliver notification to {channel.value}: {e}")
     
-    def _deliver_console(self, notification: Notification) -> None:
-        """Deliver notification to console."""
-        from rich.console import Console
-        console = Console()
-        console.print(notification.format_console())
+    def _deliver_console(self, notifications: List[Notification]) -> None:
+        """Deliver notifications to console with a single print."""
+        _get_console().print("\n".join(n.format_console() for n in notifications))
     
-    def _deliver_file(self, notification: Notification) -> None:
-        """Deliver notification to log file."""
-        log_file = self.history_file.parent / "notifications.log"
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(f"[{notification.formatted_time()}] {notification.level.value.upper()}: {notification.title} - {notification.message}\n")
+    def _deliver_file(self, notifications: List[Notification]) -> None:
+        """
+        Deliver notifications to the log file.
+        
+        The log is kept open as a buffered binary handle and flushed once
+        per batch instead of being reopened for every notification.
+        """
+        if self._log_fp is None:
+            log_file = self.history_file.parent / "notifications.log"
+            self._log_fp = open(log_file, 'ab', buffering=1 << 16)
+        
+        self._log_fp.write("".join(
+            f"[{n.formatted_time()}] {n.level.value.upper()}: {n.title} - {n.message}\n"
+            for n in notifications
+        ).encode('utf-8'))
+        self._log_fp.flush()
     
     def _deliver_desktop(self, notification: Notification) -> None:
         """Deliver desktop notification (platform-specific)."""
         try:
-            import platform
-            system = platform.system()
-            
-            if system == "Windows":
+            if _PLATFORM == "Windows":
                 self._desktop_windows(notification)
-            elif system == "Darwin":  # macOS
+            elif _PLATFORM == "Darwin":  # macOS
                 self._desktop_macos(notification)
-            elif system == "Linux":
+            elif _PLATFORM == "Linux":
                 self._desktop_linux(notification)
         except Exception as e:
             logger.debug(f"Desktop notification not available: {e}")
@@ -320,13 +491,31 @@ class NotificationManager:
     def _desktop_macos(self, notification: Notification) -> None:
         """macOS desktop notification."""
         import subprocess
-        script = f'display notification "{notification.message}" with title "{notification.title}"'
-        subprocess.run(['osascript', '-e', script])
+        # Title and message are passed as script arguments rather than
+        # formatted into the AppleScript source, so quotes cannot break out
+        subprocess.run(
+            [
+                'osascript',
+                '-e', 'on run argv',
+                '-e', 'display notification (item 2 of argv) with title (item 1 of argv)',
+                '-e', 'end run',
+                notification.title,
+                notification.message
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
     
     def _desktop_linux(self, notification: Notification) -> None:
         """Linux desktop notification."""
         import subprocess
-        subprocess.run(['notify-send', notification.title, notification.message])
+        subprocess.run(
+            ['notify-send', '--', notification.title, notification.message],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
     
     def _deliver_webhook(self, notification: Notification) -> None:
         """Deliver notification to webhook."""
@@ -340,17 +529,18 @@ class NotificationManager:
         Args:
             notification: Notification to broadcast
         """
-        # Notify category-specific subscribers
-        if notification.category in self._subscribers:
-            for callback in self._subscribers[notification.category]:
+        # Notify category-specific subscribers (snapshot, so callbacks may unsubscribe)
+        category_subscribers = self._subscribers.get(notification.category)
+        if category_subscribers and category_subscribers is not self._global_subscribers:
+            for callback in tuple(category_subscribers):
                 try:
                     callback(notification)
                 except Exception as e:
                     logger.error(f"Subscriber callback failed: {e}")
         
         # Notify global subscribers
-        if "*" in self._subscribers:
-            for callback in self._subscribers["*"]:
+        if self._global_subscribers:
+            for callback in tuple(self._global_subscribers):
                 try:
                     callback(notification)
                 except Exception as e:
@@ -364,9 +554,7 @@ class NotificationManager:
             category: Notification category ("*" for all)
             callback: Function to call when notification is sent
         """
-        if category not in self._subscribers:
-            self._subscribers[category] = []
-        self._subscribers[category].append(callback)
+        self._subscribers.setdefault(category, {})[callback] = None
         logger.debug(f"Added subscriber for category: {category}")
     
     def unsubscribe(self, category: str, callback: Callable) -> bool:
@@ -380,13 +568,12 @@ class NotificationManager:
         Returns:
             True if unsubscribed successfully
         """
-        if category in self._subscribers:
-            try:
-                self._subscribers[category].remove(callback)
-                return True
-            except ValueError:
-                pass
-        return False
+        subscribers = self._subscribers.get(category)
+        if subscribers is None or callback not in subscribers:
+            return False
+        
+        del subscribers[callback]
+        return True
     
     def get_history(
         self,
@@ -405,20 +592,21 @@ class NotificationManager:
         Returns:
             List of notifications (most recent first)
         """
-        notifications = list(reversed(self._history))
+        # Walk newest first lazily so a count limit stops the scan early
+        notifications: Iterable[Notification] = reversed(self._history)
         
         # Apply filters
         if level:
-            notifications = [n for n in notifications if n.level == level]
+            notifications = (n for n in notifications if n.level == level)
         
         if category:
-            notifications = [n for n in notifications if n.category == category]
+            notifications = (n for n in notifications if n.category == category)
         
         # Apply count limit
         if count:
-            notifications = notifications[:count]
+            notifications = islice(notifications, count)
         
-        return notifications
+        return list(notifications)
     
     def clear_history(self) -> None:
         """Clear notification history."""
@@ -426,47 +614,142 @@ class NotificationManager:
         self.save_history()
         logger.info("Notification history cleared")
     
+    def _append_history(self, notifications: List[Notification]) -> None:
+        """
+        Append notifications to the history file.
+        
+        The file is kept open in append mode with a large buffer, so each
+        batch costs one buffered write instead of a full rewrite.
+        
+        Args:
+            notifications: Notifications to persist, oldest first
+        """
+        if not self.config.persist:
+            return
+        
+        data = _encode_records(notifications)
+        
+        with self._io_lock:
+            try:
+                if self._history_fp is None:
+                    self._history_fp = open(self.history_file, 'ab', buffering=1 << 16)
+                self._history_fp.write(data)
+            except Exception as e:
+                logger.error(f"Failed to append notification history: {e}")
+    
+    def close(self) -> None:
+        """Stop the worker after draining the queue and close open files."""
+        atexit.unregister(self._atexit_hook)
+        
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+        
+        if self._log_fp is not None:
+            try:
+                self._log_fp.close()
+            except Exception as e:
+                logger.error(f"Failed to close notification log: {e}")
+            self._log_fp = None
+        
+        with self._io_lock:
+            self._close_history_file()
+    
+    def _close_history_file(self) -> None:
+        """Flush and close the history file handle. Caller holds _io_lock."""
+        if self._history_fp is not None:
+            try:
+                self._history_fp.close()
+            except Exception as e:
+                logger.error(f"Failed to close notification history: {e}")
+            self._history_fp = None
+    
     def save_history(self) -> bool:
         """
-        Save notification history to disk.
+        Rewrite the notification history file from memory.
+        
+        Used to truncate or compact the file; regular notifications are
+        appended one line at a time. Does nothing when persistence is
+        disabled in the configuration.
         
         Returns:
             True if saved successfully
         """
-        try:
-            data = {
-                "version": "1.0",
-                "notifications": [n.to_dict() for n in self._history]
-            }
-            
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            
+        if not self.config.persist:
             return True
+        
+        # Let queued appends land first so they are not written after the rewrite
+        self.flush()
+        
+        with self._io_lock:
+            self._close_history_file()
             
-        except Exception as e:
-            logger.error(f"Failed to save notification history: {e}")
-            return False
+            try:
+                with open(self.history_file, 'wb') as f:
+                    f.write(_encode_records(self._history))
+                
+                return True
+                
+            except Exception as e:
+                logger.error(f"Failed to save notification history: {e}")
+                return False
     
     def load_history(self) -> bool:
         """
         Load notification history from disk.
         
+        Reads the file line by line into the bounded history deque, then
+        compacts the file if it holds more entries than are kept. History
+        in the older single JSON document format, either in the history
+        file itself or in a notifications.json next to it, is imported and
+        rewritten as JSON Lines.
+        
         Returns:
             True if loaded successfully
         """
-        if not self.history_file.exists():
-            return True
+        source = self.history_file
+        if not source.exists():
+            legacy_file = source.with_name(self.LEGACY_HISTORY_NAME)
+            if legacy_file == source or not legacy_file.exists():
+                return True
+            source = legacy_file
         
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            notifications = data.get("notifications", [])
             self._history.clear()
             
-            for notif_data in notifications:
-                self._history.append(Notification.from_dict(notif_data))
+            with open(source, 'rb') as f:
+                data = f.read()
+            
+            legacy_records = self._parse_legacy_history(data)
+            if legacy_records is not None:
+                for record in legacy_records:
+                    try:
+                        self._history.append(Notification.from_dict(record))
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.debug(f"Skipping invalid history entry: {e}")
+                
+                # Keep the old file untouched if none of its entries could be read
+                if self._history or not legacy_records:
+                    logger.info(f"Migrating notification history from {source} to JSON Lines")
+                    self.save_history()
+            else:
+                line_count = 0
+                for line in data.splitlines():
+                    if not line.strip():
+                        continue
+                    line_count += 1
+                    try:
+                        self._history.append(Notification.from_dict(_decode_record(line)))
+                    except (ValueError, KeyError, TypeError) as e:
+                        # Skip a partially written or malformed line
+                        logger.debug(f"Skipping invalid history line: {e}")
+                
+                # Never compact when nothing was readable: that would erase the file
+                if self._history and line_count > len(self._history):
+                    self.save_history()
             
             logger.debug(f"Loaded {len(self._history)} notifications from history")
             return True
@@ -474,6 +757,35 @@ class NotificationManager:
         except Exception as e:
             logger.error(f"Failed to load notification history: {e}")
             return False
+    
+    @staticmethod
+    def _parse_legacy_history(data: bytes) -> Optional[List[Dict]]:
+        """
+        Parse history written in the older single-document format.
+        
+        That format was pretty-printed JSON: either a bare array or an
+        object with a "notifications" array, so it starts with "[" or with
+        a line holding only "{". A JSON Lines record never does.
+        
+        Returns:
+            List of notification records, or None if data is JSON Lines
+        """
+        content = data.lstrip()
+        first_line = content.split(b"\n", 1)[0].strip()
+        if not (content.startswith(b"[") or first_line == b"{"):
+            return None
+        
+        document = json.loads(content.decode('utf-8'))
+        if isinstance(document, dict):
+            document = document.get("notifications", [])
+        return [record for record in document if isinstance(record, dict)]
+
+
+def _close_at_exit(manager_ref: "weakref.ReferenceType[NotificationManager]") -> None:
+    """Close a notification manager at interpreter exit if it is still alive."""
+    manager = manager_ref()
+    if manager is not None:
+        manager.close()
 
 
 # Global notification manager instance
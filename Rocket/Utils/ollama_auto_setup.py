@@ -20,32 +20,263 @@ Author: Rocket AI Team
 
 import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict
 import json
 import logging
 
+# Required for hardware detection; checked by _require_psutil() where used
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Optional: NVIDIA Management Library bindings (pip install nvidia-ml-py)
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# PCI vendor IDs of the GPU vendors we recognize
+_GPU_VENDOR_IDS = {
+    0x10DE: "nvidia",
+    0x1002: "amd",
+    0x8086: "intel",
+}
+
+# DXGI_ADAPTER_FLAG_SOFTWARE: the Microsoft Basic Render Driver
+_DXGI_ADAPTER_FLAG_SOFTWARE = 0x2
+
+# CPU name line in /proc/cpuinfo (Linux)
+_CPUINFO_MODEL_NAME = re.compile(rb"^model name[ \t]*:[ \t]*(\S.*)$", re.MULTILINE)
+
+# Progress output of "ollama pull", e.g. "pulling 8eeb52dfb3bb...  45% ▕██  ▏ 2.1 GB/4.7 GB"
+_PULL_PERCENT = re.compile(r"(\d{1,3})%")
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+
+@lru_cache(maxsize=1)
+def _enumerate_sysfs_display_vendors() -> Optional[Tuple[int, ...]]:
+    """
+    Collect PCI vendor IDs of display controllers from sysfs (Linux only).
+    
+    Reads /sys/bus/pci/devices/*/{class,vendor}; display controllers have
+    a class code starting with 0x03. No lspci process is needed.
+    
+    Returns:
+        Tuple of vendor IDs, or None if sysfs is unavailable
+    """
+    devices_dir = Path("/sys/bus/pci/devices")
+    try:
+        devices = list(devices_dir.iterdir())
+    except OSError:
+        return None
+    
+    vendors = []
+    for device in devices:
+        try:
+            if (device / "class").read_text().strip().startswith("0x03"):
+                vendors.append(int((device / "vendor").read_text().strip(), 16))
+        except (OSError, ValueError):
+            continue
+    
+    return tuple(vendors)
+
+
+def _require_psutil() -> None:
+    """Raise a clear error when psutil is needed but not installed."""
+    if psutil is None:
+        raise ImportError(
+            "psutil is required for hardware detection. Install it with: pip install psutil"
+        )
+
+
+@lru_cache(maxsize=1)
+def _enumerate_dxgi_adapters() -> Optional[Tuple[Tuple[int, str, int], ...]]:
+    """
+    Enumerate hardware display adapters through DXGI (Windows only).
+    
+    Calls CreateDXGIFactory1 and IDXGIFactory1::EnumAdapters1 via ctypes,
+    which avoids starting a WMI host process. The result is cached since
+    adapters do not change while the CLI runs.
+    
+    Returns:
+        Tuple of (vendor_id, description, dedicated_vram_bytes) per adapter,
+        or None if DXGI is unavailable
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+        
+        class GUID(ctypes.Structure):
+            _fields_ = [
+                ("Data1", wintypes.DWORD),
+                ("Data2", wintypes.WORD),
+                ("Data3", wintypes.WORD),
+                ("Data4", ctypes.c_ubyte * 8),
+            ]
+        
+        class DXGI_ADAPTER_DESC1(ctypes.Structure):
+            _fields_ = [
+                ("Description", ctypes.c_wchar * 128),
+                ("VendorId", wintypes.UINT),
+                ("DeviceId", wintypes.UINT),
+                ("SubSysId", wintypes.UINT),
+                ("Revision", wintypes.UINT),
+                ("DedicatedVideoMemory", ctypes.c_size_t),
+                ("DedicatedSystemMemory", ctypes.c_size_t),
+                ("SharedSystemMemory", ctypes.c_size_t),
+                ("AdapterLuidLowPart", wintypes.DWORD),
+                ("AdapterLuidHighPart", wintypes.LONG),
+                ("Flags", wintypes.UINT),
+            ]
+        
+        def com_method(obj, index, restype, *argtypes):
+            """Get a callable for a COM vtable slot."""
+            vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+            return ctypes.WINFUNCTYPE(restype, ctypes.c_void_p, *argtypes)(vtable[index])
+        
+        # IID_IDXGIFactory1: {770aae78-f26f-4dba-a829-253c83d1b387}
+        iid = GUID(
+            0x770AAE78, 0xF26F, 0x4DBA,
+            (ctypes.c_ubyte * 8)(0xA8, 0x29, 0x25, 0x3C, 0x83, 0xD1, 0xB3, 0x87)
+        )
+        factory = ctypes.c_void_p()
+        if ctypes.WinDLL("dxgi").CreateDXGIFactory1(ctypes.byref(iid), ctypes.byref(factory)) != 0:
+            return None
+        
+        adapters = []
+        try:
+            # IDXGIFactory1::EnumAdapters1 is vtable slot 12
+            enum_adapters = com_method(
+                factory, 12, ctypes.c_long, wintypes.UINT, ctypes.POINTER(ctypes.c_void_p)
+            )
+            index = 0
+            while True:
+                adapter = ctypes.c_void_p()
+                # Fails with DXGI_ERROR_NOT_FOUND after the last adapter
+                if enum_adapters(factory, index, ctypes.byref(adapter)) != 0:
+                    break
+                try:
+                    # IDXGIAdapter1::GetDesc1 is vtable slot 10
+                    desc = DXGI_ADAPTER_DESC1()
+                    get_desc = com_method(
+                        adapter, 10, ctypes.c_long, ctypes.POINTER(DXGI_ADAPTER_DESC1)
+                    )
+                    if get_desc(adapter, ctypes.byref(desc)) == 0 and not (
+                        desc.Flags & _DXGI_ADAPTER_FLAG_SOFTWARE
+                    ):
+                        adapters.append(
+                            (desc.VendorId, desc.Description.strip(), desc.DedicatedVideoMemory)
+                        )
+                finally:
+                    com_method(adapter, 2, ctypes.c_ulong)(adapter)  # IUnknown::Release
+                index += 1
+        finally:
+            com_method(factory, 2, ctypes.c_ulong)(factory)  # IUnknown::Release
+        
+        return tuple(adapters)
+    except Exception as e:
+        logger.debug(f"DXGI adapter enumeration failed: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _enumerate_pci_display_devices() -> Optional[Tuple[Tuple[int, str], ...]]:
+    """
+    Enumerate PCI display devices from the Windows registry.
+    
+    Walks HKLM\\SYSTEM\\CurrentControlSet\\Enum\\PCI, whose subkeys are named
+    like "VEN_10DE&DEV_2684&...", and keeps instances of the Display class.
+    Enum\\PCI also remembers hardware that has been removed, so only
+    instances with the volatile "Control" subkey, which Windows creates
+    for devices that are currently present, are reported. Needs no
+    subprocess or COM, so it is a cheap fallback when DXGI fails.
+    
+    Returns:
+        Tuple of (vendor_id, description) per device, or None if the
+        registry is unavailable
+    """
+    try:
+        import winreg
+    except ImportError:
+        return None
+    
+    devices = []
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Enum\PCI") as pci:
+            for device_index in range(winreg.QueryInfoKey(pci)[0]):
+                device_id = winreg.EnumKey(pci, device_index)
+                if not device_id.upper().startswith("VEN_"):
+                    continue
+                try:
+                    vendor_id = int(device_id[4:8], 16)
+                except ValueError:
+                    continue
+                if vendor_id not in _GPU_VENDOR_IDS:
+                    continue
+                
+                with winreg.OpenKey(pci, device_id) as device:
+                    for instance_index in range(winreg.QueryInfoKey(device)[0]):
+                        instance_id = winreg.EnumKey(device, instance_index)
+                        try:
+                            with winreg.OpenKey(device, instance_id) as instance:
+                                if winreg.QueryValueEx(instance, "Class")[0] != "Display":
+                                    continue
+                                description = winreg.QueryValueEx(instance, "DeviceDesc")[0]
+                                # Raises OSError for devices that are no longer installed
+                                winreg.OpenKey(instance, "Control").Close()
+                        except OSError:
+                            continue
+                        # Values look like "@oem12.inf,%amd7448.1%;AMD Radeon RX 7900 XTX"
+                        devices.append((vendor_id, description.rsplit(";", 1)[-1].strip()))
+    except OSError as e:
+        logger.debug(f"PCI registry enumeration failed: {e}")
+        return None
+    
+    return tuple(devices)
+
 
-class ModelSize(Enum):
-    """Model size categories based on parameter count"""
-    TINY = "1.5B"      # 1-2B parameters
-    SMALL = "3B"       # 3B parameters
-    MEDIUM = "7B"      # 7B parameters
-    LARGE = "13B"      # 13B parameters
-    XLARGE = "32B"     # 32B+ parameters
+class ModelSize(IntEnum):
+    """Model size categories, valued by parameter count so they order numerically"""
+    TINY = 1_500_000_000      # 1-2B parameters
+    SMALL = 3_000_000_000     # 3B parameters
+    MEDIUM = 7_000_000_000    # 7B parameters
+    LARGE = 13_000_000_000    # 13B parameters
+    XLARGE = 32_000_000_000   # 32B+ parameters
+    
+    @property
+    def label(self) -> str:
+        """Display label such as 1.5B"""
+        return f"{self.value / 1_000_000_000:g}B"
 
 
 @dataclass
+class GpuInfo:
+    """A single GPU reported by a vendor query"""
+    name: str
+    vram_gb: float
+    driver: Optional[str] = None
+    compute_cap: Optional[str] = None  # CUDA compute capability, e.g. "8.9"
+
+
+@dataclass(frozen=True)
 class SystemCapabilities:
-    """System hardware capabilities"""
+    """System hardware capabilities (immutable, so it can key caches)"""
     # CPU
     cpu_count_physical: int
     cpu_count_logical: int
@@ -67,25 +298,24 @@ class SystemCapabilities:
     
     def __str__(self) -> str:
         """Human-readable summary"""
-        lines = [
-            f"System Capabilities:",
-            f"  CPU: {self.cpu_brand} ({self.cpu_count_physical} cores, {self.cpu_count_logical} threads)",
-            f"  RAM: {self.ram_total_gb:.1f} GB total, {self.ram_available_gb:.1f} GB available",
-        ]
-        
-        if self.has_gpu:
-            lines.append(f"  GPU: {self.gpu_name} ({self.gpu_vendor})")
-            if self.gpu_vram_gb:
-                lines.append(f"  VRAM: {self.gpu_vram_gb:.1f} GB")
-        else:
-            lines.append("  GPU: None")
-        
-        lines.append(f"  Platform: {self.os_type} {self.architecture}")
-        
-        return "\n".join(lines)
+        return (
+            f"System Capabilities:\n"
+            f"  CPU: {self.cpu_brand} ({self.cpu_count_physical} cores, {self.cpu_count_logical} threads)\n"
+            f"  RAM: {self.ram_total_gb:.1f} GB total, {self.ram_available_gb:.1f} GB available\n"
+            f"{self._gpu_lines()}"
+            f"  Platform: {self.os_type} {self.architecture}"
+        )
+    
+    def _gpu_lines(self) -> str:
+        """GPU (and VRAM) lines of the summary, newline-terminated"""
+        if not self.has_gpu:
+            return "  GPU: None\n"
+        if self.gpu_vram_gb:
+            return f"  GPU: {self.gpu_name} ({self.gpu_vendor})\n  VRAM: {self.gpu_vram_gb:.1f} GB\n"
+        return f"  GPU: {self.gpu_name} ({self.gpu_vendor})\n"
 
 
-@dataclass
+@dataclass(frozen=True)
 class OllamaModelRecommendation:
     """Recommended Ollama model configuration"""
     model_name: str
@@ -95,47 +325,140 @@ class OllamaModelRecommendation:
     estimated_speed: str  # "fast", "medium", "slow"
     
     def __str__(self) -> str:
-        return f"{self.model_name} ({self.model_size.value} parameters) - {self.reason}"
+        return f"{self.model_name} ({self.model_size.label} parameters) - {self.reason}"
 
 
 class SystemDetector:
     """Detects system hardware capabilities"""
     
-    def __init__(self):
+    # CPU/GPU detection results are reused for this long
+    CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+    # Bump when the cached fields change
+    CACHE_VERSION = 1
+    # SystemCapabilities fields stored in the cache
+    CACHED_FIELDS = frozenset({
+        "cpu_count_physical", "cpu_count_logical", "cpu_brand",
+        "has_gpu", "gpu_name", "gpu_vram_gb", "gpu_vendor",
+    })
+    # Vendor tools answer in milliseconds; longer means a hung driver
+    PROBE_TIMEOUT = 2
+    
+    def __init__(self, cache_file: Optional[Path] = None):
         self.os_type = platform.system()
         self.architecture = platform.machine()
+        self.cache_file = cache_file or (Path.home() / ".rocket-cli" / "system_capabilities.json")
+        # Brand string read by _detect_cpu, reused by the Apple GPU probe
+        self._cached_cpu_brand: Optional[str] = None
+        # Set when a probe timed out or failed, so "no GPU" may be wrong
+        self._probe_failed = False
     
-    def detect_all(self) -> SystemCapabilities:
-        """Detect all system capabilities"""
-        logger.info("Detecting system capabilities...")
+    def detect_all(self, use_cache: bool = True) -> SystemCapabilities:
+        """
+        Detect all system capabilities.
+        
+        CPU and GPU details are slow to probe and rarely change, so they are
+        cached on disk for CACHE_TTL_SECONDS. RAM is always measured because
+        available memory differs from run to run. Results are not cached
+        when a probe timed out or failed, so the next run tries again.
+        
+        Args:
+            use_cache: Reuse cached CPU/GPU details when valid; pass False to
+                force a full re-detection and refresh the cache
+        """
+        hardware = self._load_cached_hardware() if use_cache else None
+        
+        if hardware is None:
+            logger.info("Detecting system capabilities...")
+            self._probe_failed = False
+            cpu_physical, cpu_logical, cpu_brand = self._detect_cpu()
+            has_gpu, gpu_name, gpu_vram, gpu_vendor = self._detect_gpu()
+            hardware = {
+                "cpu_count_physical": cpu_physical,
+                "cpu_count_logical": cpu_logical,
+                "cpu_brand": cpu_brand,
+                "has_gpu": has_gpu,
+                "gpu_name": gpu_name,
+                "gpu_vram_gb": gpu_vram,
+                "gpu_vendor": gpu_vendor,
+            }
+            if self._probe_failed:
+                logger.debug("Not caching hardware details: a probe timed out or failed")
+            else:
+                self._save_cached_hardware(hardware)
+        else:
+            logger.debug(f"Using cached hardware details from {self.cache_file}")
         
-        cpu_physical, cpu_logical, cpu_brand = self._detect_cpu()
         ram_total, ram_available = self._detect_ram()
-        has_gpu, gpu_name, gpu_vram, gpu_vendor = self._detect_gpu()
         
         caps = SystemCapabilities(
-            cpu_count_physical=cpu_physical,
-            cpu_count_logical=cpu_logical,
-            cpu_brand=cpu_brand,
             ram_total_gb=ram_total,
             ram_available_gb=ram_available,
-            has_gpu=has_gpu,
-            gpu_name=gpu_name,
-            gpu_vram_gb=gpu_vram,
-            gpu_vendor=gpu_vendor,
             os_type=self.os_type,
-            architecture=self.architecture
+            architecture=self.architecture,
+            **hardware
         )
         
         logger.info(f"\n{caps}")
         return caps
     
+    def _cache_key(self) -> str:
+        """Identify the machine the cached hardware details belong to."""
+        return f"{platform.node()}|{self.os_type}|{self.architecture}"
+    
+    def _load_cached_hardware(self) -> Optional[Dict]:
+        """
+        Load cached CPU/GPU details.
+        
+        Returns:
+            Hardware fields, or None if the cache is missing, expired, from
+            another machine, written by a different cache version, or does
+            not hold exactly the expected fields
+        """
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            hardware = data.get("hardware")
+            if (
+                data.get("version") == self.CACHE_VERSION
+                and data.get("key") == self._cache_key()
+                and time.time() - data.get("timestamp", 0) < self.CACHE_TTL_SECONDS
+                and isinstance(hardware, dict)
+                and hardware.keys() == self.CACHED_FIELDS
+            ):
+                return hardware
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable hardware cache: {e}")
+        
+        return None
+    
+    def _save_cached_hardware(self, hardware: Dict) -> None:
+        """Write CPU/GPU details to the cache file atomically."""
+        data = {
+            "version": self.CACHE_VERSION,
+            "key": self._cache_key(),
+            "timestamp": time.time(),
+            "hardware": hardware,
+        }
+        
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.debug(f"Could not write hardware cache: {e}")
+    
     def _detect_cpu(self) -> Tuple[int, int, str]:
         """Detect CPU information"""
-        import psutil
+        _require_psutil()
         
+        physical_count = psutil.cpu_count(logical=False)
         logical_count = psutil.cpu_count(logical=True)
-        physical_count = psutil.cpu_count(logical=False) or logical_count
+        physical_count = physical_count or logical_count
         
         # Try to get CPU brand
         cpu_brand = "Unknown CPU"
@@ -146,25 +469,26 @@ class SystemDetector:
                                     r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
                 cpu_brand = winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
             elif self.os_type == "Linux":
-                with open("/proc/cpuinfo") as f:
-                    for line in f:
-                        if "model name" in line:
-                            cpu_brand = line.split(":")[1].strip()
-                            break
+                with open("/proc/cpuinfo", "rb") as f:
+                    match = _CPUINFO_MODEL_NAME.search(f.read())
+                if match:
+                    cpu_brand = match.group(1).decode("utf-8", "replace").strip()
             elif self.os_type == "Darwin":  # macOS
                 result = subprocess.run(
                     ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True, text=True
+                    capture_output=True, text=True, timeout=self.PROBE_TIMEOUT
                 )
                 cpu_brand = result.stdout.strip()
+            self._cached_cpu_brand = cpu_brand
         except Exception as e:
             logger.warning(f"Could not detect CPU brand: {e}")
+            self._probe_failed = True
         
         return physical_count, logical_count, cpu_brand
     
     def _detect_ram(self) -> Tuple[float, float]:
         """Detect RAM information in GB"""
-        import psutil
+        _require_psutil()
         
         memory = psutil.virtual_memory()
         total_gb = memory.total / (1024 ** 3)
@@ -173,128 +497,326 @@ class SystemDetector:
         return total_gb, available_gb
     
     def _detect_gpu(self) -> Tuple[bool, Optional[str], Optional[float], Optional[str]]:
-        """Detect GPU information"""
-        
-        # Try NVIDIA first (most common for AI/ML)
-        gpu_info = self._detect_nvidia_gpu()
-        if gpu_info[0]:
-            return gpu_info
+        """
+        Detect GPU information.
         
-        # Try AMD
-        gpu_info = self._detect_amd_gpu()
-        if gpu_info[0]:
-            return gpu_info
+        All vendor probes run concurrently, so the total wait is the slowest
+        probe rather than the sum of all of them. Results are still taken
+        in priority order: NVIDIA (most common for AI/ML), AMD, Apple
+        Silicon, then Intel integrated graphics.
         
-        # Check for Apple Silicon
-        gpu_info = self._detect_apple_gpu()
-        if gpu_info[0]:
-            return gpu_info
+        A probe that times out or raises is skipped and sets _probe_failed,
+        since its "no GPU" answer cannot be trusted.
+        """
+        probes = (
+            self._detect_nvidia_gpu,
+            self._detect_amd_gpu,
+            self._detect_apple_gpu,
+            self._detect_intel_gpu,
+        )
         
-        # Check for Intel integrated graphics
-        gpu_info = self._detect_intel_gpu()
-        if gpu_info[0]:
-            return gpu_info
+        executor = ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="gpu-probe")
+        futures = [executor.submit(probe) for probe in probes]
+        try:
+            for future in futures:
+                try:
+                    gpu_info = future.result()
+                except subprocess.TimeoutExpired as e:
+                    logger.debug(f"GPU probe timed out: {e}")
+                    self._probe_failed = True
+                    continue
+                except Exception as e:
+                    logger.debug(f"GPU probe failed: {e}")
+                    self._probe_failed = True
+                    continue
+                if gpu_info[0]:
+                    return gpu_info
+        finally:
+            # Don't wait for lower-priority probes once a result is chosen
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
         
         return False, None, None, None
     
     def _detect_nvidia_gpu(self) -> Tuple[bool, Optional[str], Optional[float], Optional[str]]:
-        """Detect NVIDIA GPU using nvidia-smi"""
+        """Detect NVIDIA GPU using NVML, falling back to nvidia-smi"""
+        gpus = self._query_nvml()
+        if gpus is None:
+            gpus = self._query_nvidia_smi()
+        
+        if gpus:
+            # Report the adapter with the most VRAM
+            gpu = max(gpus, key=lambda info: info.vram_gb)
+            logger.debug(f"NVIDIA GPU: {gpu}")
+            return True, gpu.name, gpu.vram_gb, "nvidia"
+        
+        return False, None, None, None
+    
+    def _query_nvml(self) -> Optional[List[GpuInfo]]:
+        """
+        Query NVIDIA GPUs in-process through NVML.
+        
+        Returns:
+            List of GpuInfo, or None if NVML is unavailable
+        """
+        if pynvml is None:
+            return None
+        
+        try:
+            pynvml.nvmlInit()
+        except Exception as e:
+            logger.debug(f"NVML initialization failed: {e}")
+            return None
+        
         try:
+            try:
+                driver = pynvml.nvmlSystemGetDriverVersion()
+                if isinstance(driver, bytes):
+                    driver = driver.decode("utf-8", "replace")
+            except Exception:
+                driver = None
+            
+            gpus = []
+            for index in range(pynvml.nvmlDeviceGetCount()):
+                handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+                name = pynvml.nvmlDeviceGetName(handle)
+                if isinstance(name, bytes):
+                    name = name.decode("utf-8", "replace")
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                try:
+                    major, minor = pynvml.nvmlDeviceGetCudaComputeCapability(handle)
+                    compute_cap = f"{major}.{minor}"
+                except Exception:
+                    compute_cap = None
+                gpus.append(GpuInfo(name, memory.total / (1024 ** 3), driver, compute_cap))
+            return gpus
+        except Exception as e:
+            logger.debug(f"NVML GPU query failed: {e}")
+            return None
+        finally:
+            try:
+                pynvml.nvmlShutdown()
+            except Exception:
+                pass
+    
+    def _query_nvidia_smi(self) -> List[GpuInfo]:
+        """
+        Query NVIDIA GPUs using a single nvidia-smi call.
+        
+        All fields are requested in one query so new attributes never need
+        an extra process. Drivers older than R510 reject compute_cap, in
+        which case the query is repeated without it.
+        
+        Returns:
+            List of GpuInfo, empty if none were found
+        
+        Raises:
+            subprocess.TimeoutExpired: If nvidia-smi hangs
+        """
+        gpus = []
+        if not shutil.which("nvidia-smi"):
+            return gpus
+        
+        for fields in ("name,memory.total,driver_version,compute_cap",
+                       "name,memory.total,driver_version"):
             result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
+                ["nvidia-smi", f"--query-gpu={fields}", "--format=csv,noheader,nounits"],
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=self.PROBE_TIMEOUT
             )
-            
             if result.returncode == 0:
-                output = result.stdout.strip()
-                if output:
-                    parts = output.split(",")
-                    gpu_name = parts[0].strip()
-                    vram_mb = float(parts[1].strip())
-                    vram_gb = vram_mb / 1024
-                    return True, gpu_name, vram_gb, "nvidia"
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
-            logger.debug(f"NVIDIA GPU detection failed: {e}")
+                break
         
-        return False, None, None, None
+        if result.returncode == 0:
+            for line in result.stdout.strip().splitlines():
+                parts = [part.strip() for part in line.split(",")]
+                if len(parts) >= 2:
+                    gpus.append(GpuInfo(
+                        name=parts[0],
+                        vram_gb=float(parts[1]) / 1024,
+                        driver=parts[2] if len(parts) > 2 else None,
+                        compute_cap=parts[3] if len(parts) > 3 else None,
+                    ))
+        
+        return gpus
     
     def _detect_amd_gpu(self) -> Tuple[bool, Optional[str], Optional[float], Optional[str]]:
-        """Detect AMD GPU"""
-        try:
-            if self.os_type == "Linux":
-                # Try rocm-smi
-                result = subprocess.run(
-                    ["rocm-smi", "--showproductname"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return True, "AMD GPU", None, "amd"
-            elif self.os_type == "Windows":
-                # Check via WMI
-                result = subprocess.run(
-                    ["wmic", "path", "win32_VideoController", "get", "name"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if "AMD" in result.stdout or "Radeon" in result.stdout:
-                    lines = result.stdout.strip().split("\n")
-                    for line in lines:
-                        if "AMD" in line or "Radeon" in line:
-                            return True, line.strip(), None, "amd"
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
-            logger.debug(f"AMD GPU detection failed: {e}")
+        """
+        Detect AMD GPU.
+        
+        Raises:
+            subprocess.TimeoutExpired: If rocm-smi or wmic hangs
+        """
+        if self.os_type == "Linux":
+            # Try rocm-smi
+            if not shutil.which("rocm-smi"):
+                return False, None, None, None
+            result = subprocess.run(
+                ["rocm-smi", "--showmeminfo", "vram", "--showproductname", "--json"],
+                capture_output=True,
+                text=True,
+                timeout=self.PROBE_TIMEOUT
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                return self._parse_rocm_smi(result.stdout)
+        elif self.os_type == "Windows":
+            gpu_info = self._detect_gpu_dxgi("amd")
+            if gpu_info is None:
+                gpu_info = self._detect_gpu_winreg("amd")
+            if gpu_info is not None:
+                return gpu_info
+            
+            # Last resort: WMI (wmic is deprecated on current Windows)
+            if not shutil.which("wmic"):
+                return False, None, None, None
+            # Output stays bytes; only the matching line is decoded
+            result = subprocess.run(
+                ["wmic", "path", "win32_VideoController", "get", "name"],
+                capture_output=True,
+                timeout=self.PROBE_TIMEOUT
+            )
+            for line in result.stdout.splitlines():
+                if b"AMD" in line or b"Radeon" in line:
+                    return True, line.strip().decode("ascii", "replace"), None, "amd"
         
         return False, None, None, None
     
+    def _parse_rocm_smi(self, output: str) -> Tuple[bool, Optional[str], Optional[float], Optional[str]]:
+        """
+        Pick the AMD GPU with the most VRAM from rocm-smi JSON output.
+        
+        Output looks like {"card0": {"Card series": "...",
+        "VRAM Total Memory (B)": "17163091968", ...}, ...}; key casing
+        varies between ROCm releases.
+        """
+        best_name, best_vram = "AMD GPU", None
+        try:
+            # Older releases may print warnings before the JSON document
+            cards = json.loads(output[output.index("{"):])
+        except ValueError as e:
+            logger.debug(f"Could not parse rocm-smi output: {e}")
+            return True, best_name, None, "amd"
+        
+        for card_id, fields in cards.items():
+            if not card_id.lower().startswith("card") or not isinstance(fields, dict):
+                continue
+            fields = {key.lower(): value for key, value in fields.items()}
+            try:
+                vram_gb = int(fields["vram total memory (b)"]) / (1024 ** 3)
+            except (KeyError, ValueError):
+                vram_gb = None
+            if best_vram is None or (vram_gb or 0) > best_vram:
+                best_vram = vram_gb or 0
+                best_name = fields.get("card series") or fields.get("card model") or "AMD GPU"
+        
+        return True, best_name, best_vram or None, "amd"
+    
     def _detect_apple_gpu(self) -> Tuple[bool, Optional[str], Optional[float], Optional[str]]:
         """Detect Apple Silicon GPU"""
-        try:
-            if self.os_type == "Darwin" and self.architecture == "arm64":
-                result = subprocess.run(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True,
-                    text=True
-                )
-                cpu_brand = result.stdout.strip()
-                if "Apple" in cpu_brand:
-                    # Apple Silicon has unified memory
-                    import psutil
-                    memory = psutil.virtual_memory()
-                    unified_memory_gb = memory.total / (1024 ** 3)
-                    return True, f"Apple {cpu_brand} GPU", unified_memory_gb, "apple"
-        except Exception as e:
-            logger.debug(f"Apple GPU detection failed: {e}")
+        if self.os_type != "Darwin" or self.architecture != "arm64":
+            return False, None, None, None
+        
+        cpu_brand = self._cached_cpu_brand
+        if cpu_brand is None:
+            result = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                capture_output=True,
+                text=True,
+                timeout=self.PROBE_TIMEOUT
+            )
+            cpu_brand = result.stdout.strip()
+        if "Apple" in cpu_brand:
+            # Apple Silicon has unified memory
+            _require_psutil()
+            memory = psutil.virtual_memory()
+            unified_memory_gb = memory.total / (1024 ** 3)
+            return True, f"Apple {cpu_brand} GPU", unified_memory_gb, "apple"
         
         return False, None, None, None
     
     def _detect_intel_gpu(self) -> Tuple[bool, Optional[str], Optional[float], Optional[str]]:
-        """Detect Intel integrated GPU"""
-        try:
-            if self.os_type == "Windows":
-                result = subprocess.run(
-                    ["wmic", "path", "win32_VideoController", "get", "name"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if "Intel" in result.stdout:
-                    lines = result.stdout.strip().split("\n")
-                    for line in lines:
-                        if "Intel" in line and "Graphics" in line:
-                            return True, line.strip(), None, "intel"
-            elif self.os_type == "Linux":
-                result = subprocess.run(
-                    ["lspci"], capture_output=True, text=True, timeout=5
-                )
-                if "Intel" in result.stdout and "VGA" in result.stdout:
+        """
+        Detect Intel integrated GPU.
+        
+        Raises:
+            subprocess.TimeoutExpired: If lspci or wmic hangs
+        """
+        if self.os_type == "Windows":
+            gpu_info = self._detect_gpu_dxgi("intel")
+            if gpu_info is None:
+                gpu_info = self._detect_gpu_winreg("intel")
+            if gpu_info is not None:
+                return gpu_info
+            
+            # Last resort: WMI (wmic is deprecated on current Windows)
+            if not shutil.which("wmic"):
+                return False, None, None, None
+            # Output stays bytes; only the matching line is decoded
+            result = subprocess.run(
+                ["wmic", "path", "win32_VideoController", "get", "name"],
+                capture_output=True,
+                timeout=self.PROBE_TIMEOUT
+            )
+            for line in result.stdout.splitlines():
+                if b"Intel" in line and b"Graphics" in line:
+                    return True, line.strip().decode("ascii", "replace"), None, "intel"
+        elif self.os_type == "Linux":
+            vendors = _enumerate_sysfs_display_vendors()
+            if vendors is not None:
+                if 0x8086 in vendors:
                     return True, "Intel Integrated Graphics", None, "intel"
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
-            logger.debug(f"Intel GPU detection failed: {e}")
+                return False, None, None, None
+            
+            # No sysfs (e.g. restricted container): fall back to lspci
+            if not shutil.which("lspci"):
+                return False, None, None, None
+            result = subprocess.run(
+                ["lspci"], capture_output=True, text=True, timeout=self.PROBE_TIMEOUT
+            )
+            if "Intel" in result.stdout and "VGA" in result.stdout:
+                return True, "Intel Integrated Graphics", None, "intel"
+        
+        return False, None, None, None
+    
+    def _detect_gpu_dxgi(self, vendor: str) -> Optional[Tuple[bool, Optional[str], Optional[float], Optional[str]]]:
+        """
+        Look up a vendor's display adapter through DXGI (Windows only).
+        
+        Args:
+            vendor: Vendor name from _GPU_VENDOR_IDS (e.g., "amd", "intel")
+            
+        Returns:
+            GPU info tuple, or None if DXGI enumeration is unavailable
+        """
+        adapters = _enumerate_dxgi_adapters()
+        if adapters is None:
+            return None
+        
+        for vendor_id, description, vram_bytes in adapters:
+            if _GPU_VENDOR_IDS.get(vendor_id) == vendor:
+                return True, description, (vram_bytes / (1024 ** 3)) or None, vendor
+        
+        return False, None, None, None
+    
+    def _detect_gpu_winreg(self, vendor: str) -> Optional[Tuple[bool, Optional[str], Optional[float], Optional[str]]]:
+        """
+        Look up a vendor's display adapter in the PCI registry (Windows only).
+        
+        Args:
+            vendor: Vendor name from _GPU_VENDOR_IDS (e.g., "amd", "intel")
+            
+        Returns:
+            GPU info tuple without VRAM, or None if the registry is unavailable
+        """
+        devices = _enumerate_pci_display_devices()
+        if devices is None:
+            return None
+        
+        for vendor_id, description in devices:
+            if _GPU_VENDOR_IDS.get(vendor_id) == vendor:
+                return True, description, None, vendor
         
         return False, None, None, None
 
@@ -336,35 +858,37 @@ class ModelRecommender:
         }
     }
     
+    # Selection rules, checked in order; the first match wins.
+    # (min_available_ram_gb, requirement(caps, has_powerful_gpu), size, speed, reason)
+    RULES = (
+        (40, lambda caps, gpu: gpu,
+         ModelSize.XLARGE, "medium", "High-end system with powerful GPU"),
+        (20, lambda caps, gpu: gpu or caps.cpu_count_physical >= 8,
+         ModelSize.LARGE, "medium", "High-end system"),
+        (12, lambda caps, gpu: caps.cpu_count_physical >= 4,
+         ModelSize.MEDIUM, "fast", "Mid-range system with good CPU"),
+        (8, lambda caps, gpu: True,
+         ModelSize.SMALL, "fast", "Entry-level system"),
+        (0, lambda caps, gpu: True,
+         ModelSize.TINY, "very fast", "Resource-constrained system"),
+    )
+    
     def recommend(self, caps: SystemCapabilities) -> OllamaModelRecommendation:
         """Recommend best model for system capabilities"""
-        
+        return self._recommend_cached(caps)
+    
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _recommend_cached(cls, caps: SystemCapabilities) -> OllamaModelRecommendation:
+        """Evaluate RULES for caps; results are memoized per class and caps"""
         available_ram = caps.ram_available_gb
-        has_powerful_gpu = caps.has_gpu and caps.gpu_vram_gb and caps.gpu_vram_gb >= 8
-        
-        # Decision tree for model selection
-        if available_ram >= 40 and has_powerful_gpu:
-            size = ModelSize.XLARGE
-            speed = "medium"
-            reason = "High-end system with powerful GPU"
-        elif available_ram >= 20 and (has_powerful_gpu or caps.cpu_count_physical >= 8):
-            size = ModelSize.LARGE
-            speed = "medium"
-            reason = "High-end system"
-        elif available_ram >= 12 and caps.cpu_count_physical >= 4:
-            size = ModelSize.MEDIUM
-            speed = "fast"
-            reason = "Mid-range system with good CPU"
-        elif available_ram >= 8:
-            size = ModelSize.SMALL
-            speed = "fast"
-            reason = "Entry-level system"
-        else:
-            size = ModelSize.TINY
-            speed = "very fast"
-            reason = "Resource-constrained system"
+        has_powerful_gpu = bool(caps.has_gpu and caps.gpu_vram_gb and caps.gpu_vram_gb >= 8)
         
-        model_info = self.MODELS[size]
+        for min_ram_gb, requirement, size, speed, reason in cls.RULES:
+            if available_ram >= min_ram_gb and requirement(caps, has_powerful_gpu):
+                break
+        
+        model_info = cls.MODELS[size]
         
         return OllamaModelRecommendation(
             model_name=model_info["model"],
@@ -381,7 +905,7 @@ class ModelRecommender:
         
         # Get all smaller models as fallbacks
         for size in ModelSize:
-            if size.value < primary.model_size.value:
+            if size < primary.model_size:
                 model_info = self.MODELS[size]
                 fallbacks.append(OllamaModelRecommendation(
                     model_name=model_info["model"],
@@ -391,20 +915,28 @@ class ModelRecommender:
                     estimated_speed="fast"
                 ))
         
-        return [primary] + sorted(fallbacks, key=lambda x: x.model_size.value, reverse=True)
+        return [primary] + sorted(fallbacks, key=lambda x: x.model_size, reverse=True)
 
 
 class OllamaInstaller:
     """Handles Ollama installation and configuration"""
     
+    # Abort a model pull that produces no output for this many seconds
+    PULL_IDLE_TIMEOUT = 60
+    
     def __init__(self):
         self.os_type = platform.system()
     
     def is_ollama_installed(self) -> bool:
         """Check if Ollama is installed"""
+        # Skip spawning a process when the executable cannot be found at all
+        ollama_path = self.get_ollama_path()
+        if not ollama_path:
+            return False
+        
         try:
             result = subprocess.run(
-                ["ollama", "--version"],
+                [str(ollama_path), "--version"],
                 capture_output=True,
                 timeout=5
             )
@@ -419,21 +951,9 @@ class OllamaInstaller:
             if default_path.exists():
                 return default_path
         
-        # Try which/where command
-        try:
-            cmd = "where" if self.os_type == "Windows" else "which"
-            result = subprocess.run(
-                [cmd, "ollama"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return Path(result.stdout.strip().split("\n")[0])
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        
-        return None
+        # Search PATH in-process instead of spawning which/where
+        path = shutil.which("ollama")
+        return Path(path) if path else None
     
     def install_model(self, model_name: str) -> bool:
         """Install/pull an Ollama model"""
@@ -448,16 +968,71 @@ class OllamaInstaller:
             cmd = [str(ollama_path), "pull", model_name]
             logger.info(f"Running: {' '.join(cmd)}")
             
-            result = subprocess.run(
+            # Text mode splits on the carriage returns ollama uses for progress
+            process = subprocess.Popen(
                 cmd,
-                capture_output=False,  # Show output to user
-                text=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1
             )
+        except Exception as e:
+            logger.error(f"Failed to install model: {e}")
+            return False
+        
+        last_output = time.monotonic()
+        finished = threading.Event()
+        stalled = threading.Event()
+        
+        def watchdog():
+            # Kill the pull if it stops producing output; this also ends the read loop
+            while not finished.wait(min(1.0, self.PULL_IDLE_TIMEOUT)):
+                if time.monotonic() - last_output > self.PULL_IDLE_TIMEOUT:
+                    stalled.set()
+                    process.kill()
+                    return
+        
+        threading.Thread(target=watchdog, name="ollama-pull-watchdog", daemon=True).start()
+        
+        last_percent = None
+        try:
+            for line in process.stdout:
+                last_output = time.monotonic()
+                line = _ANSI_ESCAPE.sub("", line).strip()
+                if not line:
+                    continue
+                
+                match = _PULL_PERCENT.search(line)
+                if match:
+                    # Redraw the progress line only when the percentage changes
+                    percent = int(match.group(1))
+                    if percent != last_percent:
+                        last_percent = percent
+                        print(f"\r  {model_name}: {percent:3d}%", end="", flush=True)
+                else:
+                    if last_percent is not None:
+                        print()
+                        last_percent = None
+                    print(f"  {line}")
             
-            return result.returncode == 0
+            process.wait()
         except Exception as e:
             logger.error(f"Failed to install model: {e}")
+            process.kill()
+            process.wait()
             return False
+        finally:
+            finished.set()
+            if last_percent is not None:
+                print()
+        
+        if stalled.is_set():
+            logger.error(f"Model download stalled for {self.PULL_IDLE_TIMEOUT}s, aborted")
+            return False
+        
+        return process.returncode == 0
     
     def list_installed_models(self) -> List[str]:
         """List installed Ollama models"""
@@ -470,18 +1045,22 @@ class OllamaInstaller:
             )
             
             if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")[1:]  # Skip header
-                return [line.split()[0] for line in lines if line.strip()]
+                # Skip the header row; only the NAME column is needed
+                lines = result.stdout.splitlines()[1:]
+                return [line.split(None, 1)[0] for line in lines if line.strip()]
         except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
             logger.error(f"Failed to list models: {e}")
         
         return []
 
 
-def auto_setup_ollama() -> Tuple[bool, Optional[str], Optional[str]]:
+def auto_setup_ollama(refresh: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
     """
     Automatically detect system and setup Ollama with appropriate model.
     
+    Args:
+        refresh: Ignore cached hardware details and probe the system again
+    
     Returns:
         Tuple of (success, model_name, config_key)
         - success: Whether setup completed successfully
@@ -495,7 +1074,7 @@ def auto_setup_ollama() -> Tuple[bool, Optional[str], Optional[str]]:
     
     # Detect system capabilities
     detector = SystemDetector()
-    caps = detector.detect_all()
+    caps = detector.detect_all(use_cache=not refresh)
     print()
     
     # Get model recommendation
@@ -554,12 +1133,10 @@ def auto_setup_ollama() -> Tuple[bool, Optional[str], Optional[str]]:
 
 
 if __name__ == "__main__":
-    try:
-        # Ensure psutil is available
-        import psutil
-    except ImportError:
+    # Ensure psutil is available
+    if psutil is None:
         print("Error: psutil library is required")
         print("Install it with: pip install psutil")
         sys.exit(1)
     
-    auto_setup_ollama()
+    auto_setup_ollama(refresh="--refresh" in sys.argv[1:])
@@ -20,9 +20,6 @@ Usage:
     manager.execute_hook("before_command", context={})
 """
 
-import importlib
-import importlib.util
-import inspect
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -127,6 +124,8 @@ class PluginManager:
         """
         self.plugins_dir = plugins_dir or (Path.home() / ".rocket-cli" / "plugins")
         self._loaded_plugins: Dict[str, Plugin] = {}
+        # Hooks each plugin returned at load time, so get_hooks() runs once
+        self._plugin_hooks: Dict[str, Dict[str, Callable]] = {}
         self._hooks: Dict[str, List[Callable]] = {hook: [] for hook in self.AVAILABLE_HOOKS}
         
         # Create plugins directory if needed
@@ -169,6 +168,10 @@ class PluginManager:
             logger.warning(f"Plugin '{plugin_name}' already loaded")
             return True
         
+        # Only needed when a plugin is actually loaded
+        import importlib.util
+        import inspect
+        
         try:
             # Find plugin file
             plugin_file = self.plugins_dir / f"{plugin_name}.py"
@@ -212,13 +215,15 @@ class PluginManager:
                 return False
             
             # Register hooks
-            for hook_name, hook_func in plugin.get_hooks().items():
+            plugin_hooks = plugin.get_hooks()
+            for hook_name, hook_func in plugin_hooks.items():
                 if hook_name in self._hooks:
                     self._hooks[hook_name].append(hook_func)
                     logger.debug(f"Registered hook '{hook_name}' for plugin '{plugin_name}'")
             
             # Store loaded plugin
             self._loaded_plugins[plugin_name] = plugin
+            self._plugin_hooks[plugin_name] = plugin_hooks
             
             logger.info(f"Loaded plugin: {plugin_name} v{plugin.metadata.version}")
             return True
@@ -247,15 +252,11 @@ class PluginManager:
             # Cleanup plugin
             plugin.cleanup()
             
-            # Unregister hooks
-            for hook_name, hook_funcs in self._hooks.items():
-                # Remove hooks from this plugin
-                plugin_hooks = plugin.get_hooks()
-                if hook_name in plugin_hooks:
-                    try:
-                        hook_funcs.remove(plugin_hooks[hook_name])
-                    except ValueError:
-                        pass
+            # Unregister the hooks registered at load time, matching by identity
+            plugin_hooks = self._plugin_hooks.pop(plugin_name, {})
+            plugin_hook_ids = {id(hook_func) for hook_func in plugin_hooks.values()}
+            for hook_funcs in self._hooks.values():
+                hook_funcs[:] = [f for f in hook_funcs if id(f) not in plugin_hook_ids]
             
             # Remove from loaded plugins
             del self._loaded_plugins[plugin_name]
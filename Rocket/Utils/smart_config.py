@@ -40,14 +40,16 @@ logger = get_logger(__name__)
 class ProviderSelector:
     """Intelligently selects the best AI provider for the system"""
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, refresh: bool = False):
         """
         Initialize provider selector.
         
         Args:
             config_path: Path to Rocket CLI config file
+            refresh: Ignore cached hardware details on the first detection
         """
         self.config_path = config_path or Path.home() / ".rocket" / "config.json"
+        self.refresh = refresh
         self.detector = SystemDetector()
         self.recommender = ModelRecommender()
         self.installer = OllamaInstaller()
@@ -79,6 +81,13 @@ class ProviderSelector:
         logger.info("⚠️  Using community proxy (limited features)")
         return "proxy", {"provider": "community_proxy"}
     
+    def _detect_capabilities(self) -> SystemCapabilities:
+        """Detect system capabilities, re-probing once if a refresh was requested"""
+        caps = self.detector.detect_all(use_cache=not self.refresh)
+        # The cache now holds fresh results
+        self.refresh = False
+        return caps
+    
     def _check_ollama(self) -> Optional[Dict[str, Any]]:
         """Check if Ollama is available and recommend a model"""
         
@@ -88,7 +97,7 @@ class ProviderSelector:
             return None
         
         # Detect system capabilities
-        caps = self.detector.detect_all()
+        caps = self._detect_capabilities()
         
         # Check if system can run Ollama models
         if caps.ram_available_gb < 4:
@@ -270,7 +279,7 @@ class ProviderSelector:
         
         elif provider_type == "ollama":
             # Check if model can be upgraded
-            caps = self.detector.detect_all()
+            caps = self._detect_capabilities()
             current_model = config["model"]
             recommendation = self.recommender.recommend(caps)
             
@@ -304,10 +313,15 @@ def main():
         action="store_true",
         help="Show suggestions for improving setup"
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-detect hardware instead of using cached results"
+    )
     
     args = parser.parse_args()
     
-    selector = ProviderSelector()
+    selector = ProviderSelector(refresh=args.refresh)
     
     if args.suggest:
         selector.suggest_improvements()
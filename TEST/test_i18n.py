@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for Rocket CLI internationalization
+
+Tests:
+1. System language detection
+2. Available language discovery
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_LOCALE_VARS = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+
+@pytest.fixture
+def i18n(monkeypatch):
+    """i18n module with a clean locale environment and no cached detection."""
+    from Rocket.Utils import i18n
+
+    for name in _LOCALE_VARS:
+        monkeypatch.delenv(name, raising=False)
+    i18n.get_system_language.cache_clear()
+    i18n.get_available_languages.cache_clear()
+    yield i18n
+    i18n.get_system_language.cache_clear()
+    i18n.get_available_languages.cache_clear()
+
+
+class TestSystemLanguage:
+    """Test system language detection"""
+
+    def test_windows_locale_name_normalized(self, i18n):
+        """Windows-style locale names map to language codes"""
+        with patch.object(i18n, "get_available_languages", return_value=["en", "es"]), \
+                patch("locale.getlocale", return_value=("Spanish_Spain", "1252")):
+            assert i18n.get_system_language() == "es"
+
+    def test_language_env_preferred(self, i18n, monkeypatch):
+        """The first entry of LANGUAGE wins over LANG"""
+        monkeypatch.setenv("LANGUAGE", "fr:en")
+        monkeypatch.setenv("LANG", "de_DE.UTF-8")
+        with patch.object(i18n, "get_available_languages", return_value=["de", "en", "fr"]):
+            assert i18n.get_system_language() == "fr"
+
+
+class TestAvailableLanguages:
+    """Test available language discovery"""
+
+    def test_symlinked_locale_directory_included(self, i18n, tmp_path):
+        """Locale directories reached through symlinks are listed"""
+        mo_dir = tmp_path / "pt_BR" / "LC_MESSAGES"
+        mo_dir.mkdir(parents=True)
+        (mo_dir / "rocket.mo").write_bytes(b"")
+        (tmp_path / "pt").symlink_to(tmp_path / "pt_BR", target_is_directory=True)
+
+        with patch.object(i18n, "LOCALE_DIR", tmp_path):
+            assert i18n.get_available_languages() == ["en", "pt", "pt_BR"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Tests for the Rocket CLI notification system
+
+Tests:
+1. History persistence (JSON Lines append, reload, compaction)
+2. Channel delivery
+3. Subscriptions
+4. History filtering
+5. Rate limiting
+"""
+
+import pytest
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _make_manager(tmp_path, **config_kwargs):
+    """Create a manager with no output channels and a temp history file."""
+    from Rocket.Utils.notifications import NotificationManager, NotificationConfig
+
+    config = NotificationConfig(channels=[], **config_kwargs)
+    return NotificationManager(config=config, history_file=tmp_path / "notifications.jsonl")
+
+
+class TestNotificationHistory:
+    """Test notification history persistence"""
+
+    def test_notifications_appended_as_json_lines(self, tmp_path):
+        """Each notification is written as one JSON line"""
+        manager = _make_manager(tmp_path)
+        manager.send_notification("First", "one")
+        manager.send_notification("Second", "two")
+        manager.close()
+
+        lines = manager.history_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["First", "Second"]
+
+    def test_flush_writes_pending_notifications(self, tmp_path):
+        """flush() waits for the worker and leaves the file up to date"""
+        manager = _make_manager(tmp_path, rate_limit_count=100)
+        for i in range(10):
+            manager.send_notification(f"N{i}", "message")
+        manager.flush()
+
+        lines = manager.history_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 10
+        manager.close()
+
+    def test_non_string_metadata_keys_persisted(self, tmp_path):
+        """Metadata with non-str keys does not drop its batch from history"""
+        manager = _make_manager(tmp_path, rate_limit_count=100)
+        manager.send_notification("ok1", "m")
+        manager.send_notification("bad", "m", metadata={1: "x"})
+        manager.send_notification("ok3", "m")
+        manager.close()
+
+        lines = manager.history_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["ok1", "bad", "ok3"]
+        assert json.loads(lines[1])["metadata"] == {"1": "x"}
+
+    def test_history_reloaded_from_disk(self, tmp_path):
+        """A new manager loads history written by a previous one"""
+        manager = _make_manager(tmp_path)
+        manager.send_notification("Saved", "message")
+        manager.close()
+
+        reloaded = _make_manager(tmp_path)
+        history = reloaded.get_history()
+        assert len(history) == 1
+        assert history[0].title == "Saved"
+
+    def test_history_file_compacted_on_load(self, tmp_path):
+        """Entries beyond max_history are dropped from the file on load"""
+        manager = _make_manager(tmp_path, rate_limit_count=100)
+        for i in range(5):
+            manager.send_notification(f"N{i}", "message")
+        manager.close()
+
+        reloaded = _make_manager(tmp_path, max_history=2)
+        assert [n.title for n in reloaded.get_history()] == ["N4", "N3"]
+        lines = reloaded.history_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+
+    def test_invalid_history_line_skipped(self, tmp_path):
+        """A truncated trailing line does not discard valid history"""
+        manager = _make_manager(tmp_path)
+        manager.send_notification("Valid", "message")
+        manager.close()
+        with open(manager.history_file, "a", encoding="utf-8") as f:
+            f.write('{"title": "trunc')
+
+        reloaded = _make_manager(tmp_path)
+        assert [n.title for n in reloaded.get_history()] == ["Valid"]
+
+    @pytest.mark.parametrize("wrap", [
+        lambda records: {"version": "1.0", "notifications": records},
+        lambda records: records,
+    ], ids=["object", "array"])
+    def test_legacy_history_file_converted(self, tmp_path, wrap):
+        """A history file in the old JSON document format is loaded and rewritten"""
+        from Rocket.Utils.notifications import NotificationManager, NotificationConfig
+
+        history_file = tmp_path / "notifications.json"
+        history_file.write_text(json.dumps(wrap([
+            {"title": f"Old{i}", "message": "m", "level": "info", "timestamp": 1000.0 + i,
+             "category": "general", "metadata": {}}
+            for i in range(3)
+        ]), indent=2), encoding="utf-8")
+
+        manager = NotificationManager(config=NotificationConfig(channels=[]), history_file=history_file)
+        manager.close()
+
+        assert [n.title for n in manager.get_history()] == ["Old2", "Old1", "Old0"]
+        lines = history_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Old0", "Old1", "Old2"]
+
+    def test_legacy_history_imported_from_sibling_file(self, tmp_path):
+        """notifications.json next to a new history file is imported on first load"""
+        (tmp_path / "notifications.json").write_text(json.dumps({"version": "1.0", "notifications": [
+            {"title": "Kept", "message": "m", "level": "info", "timestamp": 1000.0,
+             "category": "general", "metadata": {}}
+        ]}, indent=2), encoding="utf-8")
+
+        manager = _make_manager(tmp_path)
+        manager.close()
+
+        assert [n.title for n in manager.get_history()] == ["Kept"]
+        lines = manager.history_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Kept"]
+
+    def test_unreadable_history_not_compacted(self, tmp_path):
+        """A file with no readable records is left untouched"""
+        history_file = tmp_path / "notifications.jsonl"
+        history_file.write_text("not json\nstill not json\n", encoding="utf-8")
+
+        manager = _make_manager(tmp_path)
+        manager.close()
+
+        assert manager.get_history() == []
+        assert history_file.read_text(encoding="utf-8") == "not json\nstill not json\n"
+
+    def test_persist_disabled_skips_history_file(self, tmp_path):
+        """No history file is written when persistence is disabled"""
+        manager = _make_manager(tmp_path, persist=False)
+        manager.send_notification("Memory only", "message")
+        manager.close()
+
+        assert len(manager.get_history()) == 1
+        assert not manager.history_file.exists()
+
+    def test_clear_history_truncates_file(self, tmp_path):
+        """Clearing history empties the history file"""
+        manager = _make_manager(tmp_path)
+        manager.send_notification("Gone", "message")
+        manager.clear_history()
+
+        assert manager.get_history() == []
+        assert manager.history_file.read_text(encoding="utf-8") == ""
+
+
+class TestNotificationDelivery:
+    """Test notification channel delivery"""
+
+    def test_file_channel_writes_log_lines(self, tmp_path):
+        """The file channel appends one log line per notification"""
+        from Rocket.Utils.notifications import NotificationChannel, NotificationLevel
+
+        manager = _make_manager(tmp_path)
+        manager.config.channels = [NotificationChannel.FILE]
+        manager.send_notification("Build", "passed", NotificationLevel.SUCCESS)
+        manager.send_notification("Deploy", "failed", NotificationLevel.ERROR)
+        manager.close()
+
+        lines = (tmp_path / "notifications.log").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert lines[0].endswith("SUCCESS: Build - passed")
+        assert lines[1].endswith("ERROR: Deploy - failed")
+
+    def test_console_delivered_before_send_returns(self, tmp_path):
+        """Console output is printed synchronously, before the caller continues"""
+        from unittest.mock import patch
+        from Rocket.Utils.notifications import NotificationChannel
+
+        manager = _make_manager(tmp_path)
+        manager.config.channels = [NotificationChannel.CONSOLE]
+        with patch("Rocket.Utils.notifications._get_console") as get_console:
+            manager.send_notification("Build done", "ok")
+            get_console.return_value.print.assert_called_once()
+            manager.close()
+
+        get_console.return_value.print.assert_called_once()
+
+    def test_closed_manager_can_be_freed(self, tmp_path):
+        """close() drops the exit hook so the manager is not kept alive"""
+        import gc
+        import weakref
+
+        manager = _make_manager(tmp_path)
+        manager.send_notification("Build", "done")
+        manager.close()
+        manager_ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+
+        assert manager_ref() is None
+
+
+class TestNotificationSubscribers:
+    """Test notification subscriptions"""
+
+    def test_category_and_global_subscribers(self, tmp_path):
+        """Category subscribers get matching notifications, '*' gets all"""
+        manager = _make_manager(tmp_path)
+        build, everything = [], []
+        manager.subscribe("build", build.append)
+        manager.subscribe("*", everything.append)
+
+        manager.send_notification("A", "m", category="build")
+        manager.send_notification("B", "m", category="git")
+
+        assert [n.title for n in build] == ["A"]
+        assert [n.title for n in everything] == ["A", "B"]
+
+    def test_unsubscribe_bound_method(self, tmp_path):
+        """A bound method can be unsubscribed with a fresh reference"""
+        manager = _make_manager(tmp_path)
+        received = []
+
+        manager.subscribe("build", received.append)
+        assert manager.unsubscribe("build", received.append) is True
+        assert manager.unsubscribe("build", received.append) is False
+
+        manager.send_notification("A", "m", category="build")
+        assert received == []
+
+
+class TestNotificationFiltering:
+    """Test notification filtering"""
+
+    def test_get_history_filters_and_limits(self, tmp_path):
+        """get_history applies level/category filters and count, newest first"""
+        from Rocket.Utils.notifications import NotificationLevel
+
+        manager = _make_manager(tmp_path, rate_limit_count=100)
+        manager.send_notification("A", "m", NotificationLevel.INFO, category="build")
+        manager.send_notification("B", "m", NotificationLevel.ERROR, category="build")
+        manager.send_notification("C", "m", NotificationLevel.ERROR, category="git")
+        manager.send_notification("D", "m", NotificationLevel.ERROR, category="build")
+
+        errors = manager.get_history(level=NotificationLevel.ERROR)
+        assert [n.title for n in errors] == ["D", "C", "B"]
+
+        build_errors = manager.get_history(level=NotificationLevel.ERROR, category="build", count=1)
+        assert [n.title for n in build_errors] == ["D"]
+
+    def test_min_level_filters_notifications(self, tmp_path):
+        """Notifications below min_level are not sent"""
+        from Rocket.Utils.notifications import NotificationLevel
+
+        manager = _make_manager(tmp_path, min_level=NotificationLevel.WARNING)
+        assert manager.send_notification("Low", "m", NotificationLevel.INFO) is False
+        assert manager.send_notification("High", "m", NotificationLevel.ERROR) is True
+        assert [n.title for n in manager.get_history()] == ["High"]
+
+
+class TestNotificationRateLimit:
+    """Test notification rate limiting"""
+
+    def test_rate_limit_blocks_excess_notifications(self, tmp_path):
+        """Only rate_limit_count notifications are sent inside the window"""
+        manager = _make_manager(tmp_path, rate_limit_count=3, rate_limit_seconds=60)
+        results = [manager.send_notification(f"N{i}", "m") for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert len(manager.get_history()) == 3
+
+    def test_rate_limit_window_expires(self, tmp_path):
+        """Sends are allowed again once the oldest send leaves the window"""
+        from unittest.mock import patch
+
+        manager = _make_manager(tmp_path, rate_limit_count=2, rate_limit_seconds=10)
+        with patch("time.monotonic", side_effect=[100.0, 101.0, 105.0, 111.0]):
+            results = [manager.send_notification(f"N{i}", "m") for i in range(4)]
+
+        assert results == [True, True, False, True]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
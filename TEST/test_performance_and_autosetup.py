@@ -106,6 +106,48 @@ class TestSystemDetection:
         assert logical == 16
         assert isinstance(brand, str)
     
+    @patch('psutil.cpu_count', return_value=4)
+    def test_cpu_brand_from_proc_cpuinfo(self, mock_cpu_count):
+        """Test the CPU name is found in /proc/cpuinfo on Linux"""
+        from unittest.mock import mock_open
+        from Rocket.Utils.ollama_auto_setup import SystemDetector
+        
+        cpuinfo = (
+            b"processor\t: 0\nvendor_id\t: AuthenticAMD\n"
+            b"model name\t: AMD Ryzen 9 7950X 16-Core Processor\n"
+            b"processor\t: 1\nmodel name\t: AMD Ryzen 9 7950X 16-Core Processor\n"
+        )
+        
+        detector = SystemDetector()
+        detector.os_type = "Linux"
+        with patch("builtins.open", mock_open(read_data=cpuinfo)):
+            _, _, brand = detector._detect_cpu()
+        
+        assert brand == "AMD Ryzen 9 7950X 16-Core Processor"
+        
+        # An empty model name must not capture the following line
+        with patch("builtins.open", mock_open(read_data=b"model name\t: \nstepping\t: 1\n")):
+            _, _, brand = detector._detect_cpu()
+        
+        assert brand == "Unknown CPU"
+    
+    @patch('psutil.virtual_memory', return_value=Mock(total=32 * 1024 ** 3))
+    @patch('psutil.cpu_count', return_value=10)
+    def test_apple_gpu_reuses_cpu_brand(self, mock_cpu_count, mock_memory):
+        """Test the Apple GPU probe reuses the brand read by CPU detection"""
+        from Rocket.Utils.ollama_auto_setup import SystemDetector
+        
+        detector = SystemDetector()
+        detector.os_type = "Darwin"
+        detector.architecture = "arm64"
+        with patch("subprocess.run", return_value=Mock(stdout="Apple M2 Pro\n")) as mock_run:
+            detector._detect_cpu()
+            has_gpu, name, vram, vendor = detector._detect_apple_gpu()
+        
+        mock_run.assert_called_once()
+        assert (has_gpu, name, vendor) == (True, "Apple Apple M2 Pro GPU", "apple")
+        assert abs(vram - 32.0) < 0.1
+    
     @patch('psutil.virtual_memory')
     def test_ram_detection(self, mock_memory):
         """Test RAM detection"""
@@ -123,6 +165,322 @@ class TestSystemDetection:
         assert abs(total - 16.0) < 0.1
         assert abs(available - 8.0) < 0.1
     
+    def test_nvidia_detection_via_nvml(self):
+        """Test NVIDIA detection uses NVML and picks the largest GPU"""
+        from Rocket.Utils import ollama_auto_setup
+        
+        nvml = MagicMock()
+        nvml.nvmlDeviceGetCount.return_value = 2
+        nvml.nvmlDeviceGetHandleByIndex.side_effect = lambda i: i
+        nvml.nvmlDeviceGetName.side_effect = [b"GeForce GTX 1650", "RTX 4090"]
+        nvml.nvmlDeviceGetMemoryInfo.side_effect = [
+            Mock(total=4 * 1024 ** 3),
+            Mock(total=24 * 1024 ** 3),
+        ]
+        
+        with patch.object(ollama_auto_setup, "pynvml", nvml), patch("subprocess.run") as mock_run:
+            detector = ollama_auto_setup.SystemDetector()
+            has_gpu, name, vram, vendor = detector._detect_nvidia_gpu()
+        
+        assert (has_gpu, name, vendor) == (True, "RTX 4090", "nvidia")
+        assert abs(vram - 24.0) < 0.1
+        mock_run.assert_not_called()
+        nvml.nvmlShutdown.assert_called_once()
+    
+    def test_nvidia_smi_single_batched_query(self):
+        """Test nvidia-smi rows are parsed into GpuInfo with a legacy-driver retry"""
+        from Rocket.Utils import ollama_auto_setup
+
+        unsupported = Mock(returncode=2, stdout="")
+        legacy = Mock(returncode=0, stdout="NVIDIA GeForce GTX 1080, 8192, 470.82\n")
+
+        with patch.object(ollama_auto_setup, "pynvml", None), \
+                patch("shutil.which", return_value="/usr/bin/nvidia-smi"), \
+                patch("subprocess.run", side_effect=[unsupported, legacy]) as mock_run:
+            gpus = ollama_auto_setup.SystemDetector()._query_nvidia_smi()
+
+        assert mock_run.call_count == 2
+        assert "compute_cap" in mock_run.call_args_list[0][0][0][1]
+        assert gpus == [ollama_auto_setup.GpuInfo("NVIDIA GeForce GTX 1080", 8.0, "470.82")]
+
+        modern = Mock(returncode=0, stdout="RTX 4090, 24564, 550.54, 8.9\nRTX 3060, 12288, 550.54, 8.6\n")
+        with patch.object(ollama_auto_setup, "pynvml", None), \
+                patch("shutil.which", return_value="/usr/bin/nvidia-smi"), \
+                patch("subprocess.run", return_value=modern) as mock_run:
+            has_gpu, name, vram, vendor = ollama_auto_setup.SystemDetector()._detect_nvidia_gpu()
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[1]["timeout"] == ollama_auto_setup.SystemDetector.PROBE_TIMEOUT
+        assert (has_gpu, name, vendor) == (True, "RTX 4090", "nvidia")
+        assert abs(vram - 24.0) < 0.1
+
+    def test_amd_vram_from_rocm_smi_json(self):
+        """Test AMD name and VRAM come from one rocm-smi JSON query on Linux"""
+        from Rocket.Utils import ollama_auto_setup
+
+        output = json.dumps({
+            "card0": {"Card series": "Radeon RX 7600", "VRAM Total Memory (B)": str(8 * 1024 ** 3)},
+            "card1": {"Card Series": "Radeon RX 7900 XTX", "VRAM Total Memory (B)": str(24 * 1024 ** 3)},
+            "system": {"Driver version": "6.7.0"},
+        })
+
+        detector = ollama_auto_setup.SystemDetector()
+        detector.os_type = "Linux"
+        with patch("shutil.which", return_value="/opt/rocm/bin/rocm-smi"), \
+                patch("subprocess.run", return_value=Mock(returncode=0, stdout=output)) as mock_run:
+            has_gpu, name, vram, vendor = detector._detect_amd_gpu()
+
+        assert "--json" in mock_run.call_args[0][0]
+        assert (has_gpu, name, vendor) == (True, "Radeon RX 7900 XTX", "amd")
+        assert abs(vram - 24.0) < 0.1
+
+    def test_pci_registry_skips_removed_devices(self):
+        """Test registry entries without a Control subkey (removed hardware) are ignored"""
+        import types
+        from Rocket.Utils import ollama_auto_setup
+
+        class Key:
+            def __init__(self, subkeys=None, values=None):
+                self.subkeys = subkeys or {}
+                self.values = values or {}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def Close(self):
+                pass
+
+        def display(description, present):
+            return Key({"Control": Key()} if present else {}, {"Class": "Display", "DeviceDesc": description})
+
+        pci = Key({
+            "VEN_10DE&DEV_1B80&SUBSYS_00000000": Key({"4&1": display("@oem1.inf,%nv%;NVIDIA GeForce GTX 1080", False)}),
+            "VEN_1002&DEV_744C&SUBSYS_00000000": Key({"4&2": display("@oem2.inf,%amd%;AMD Radeon RX 7900 XTX", True)}),
+        })
+
+        def open_key(key, sub_key):
+            if key == "HKLM":
+                return pci
+            if sub_key not in key.subkeys:
+                raise OSError(sub_key)
+            return key.subkeys[sub_key]
+
+        fake_winreg = types.SimpleNamespace(
+            HKEY_LOCAL_MACHINE="HKLM",
+            OpenKey=open_key,
+            QueryInfoKey=lambda key: (len(key.subkeys), len(key.values), 0),
+            EnumKey=lambda key, index: list(key.subkeys)[index],
+            QueryValueEx=lambda key, name: (key.values[name], 1),
+        )
+
+        ollama_auto_setup._enumerate_pci_display_devices.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"winreg": fake_winreg}):
+                devices = ollama_auto_setup._enumerate_pci_display_devices()
+        finally:
+            ollama_auto_setup._enumerate_pci_display_devices.cache_clear()
+
+        assert devices == ((0x1002, "AMD Radeon RX 7900 XTX"),)
+
+    def test_windows_gpu_detection_via_wmic_bytes(self):
+        """Test the WMIC fallback matches raw output bytes"""
+        from Rocket.Utils import ollama_auto_setup
+
+        output = b"Name  \r\r\nIntel(R) Iris(R) Xe Graphics  \r\r\nAMD Radeon RX 6500M  \r\r\n"
+
+        detector = ollama_auto_setup.SystemDetector()
+        detector.os_type = "Windows"
+        with patch.object(ollama_auto_setup, "_enumerate_dxgi_adapters", return_value=None), \
+                patch.object(ollama_auto_setup, "_enumerate_pci_display_devices", return_value=None), \
+                patch("shutil.which", return_value="C:\\Windows\\System32\\wbem\\wmic.exe"), \
+                patch("subprocess.run", return_value=Mock(returncode=0, stdout=output)):
+            assert detector._detect_amd_gpu() == (True, "AMD Radeon RX 6500M", None, "amd")
+            assert detector._detect_intel_gpu() == (True, "Intel(R) Iris(R) Xe Graphics", None, "intel")
+
+    def test_linux_intel_gpu_detection_via_sysfs(self):
+        """Test Intel graphics on Linux are found through sysfs without lspci"""
+        from Rocket.Utils import ollama_auto_setup
+
+        detector = ollama_auto_setup.SystemDetector()
+        detector.os_type = "Linux"
+        with patch.object(ollama_auto_setup, "_enumerate_sysfs_display_vendors", return_value=(0x10DE, 0x8086)), \
+                patch("subprocess.run") as mock_run:
+            assert detector._detect_intel_gpu() == (True, "Intel Integrated Graphics", None, "intel")
+
+        with patch.object(ollama_auto_setup, "_enumerate_sysfs_display_vendors", return_value=(0x10DE,)), \
+                patch("subprocess.run") as mock_run:
+            assert detector._detect_intel_gpu() == (False, None, None, None)
+
+        mock_run.assert_not_called()
+
+    def test_gpu_probes_skip_missing_tools(self):
+        """Test vendor tools that are not on PATH are never spawned"""
+        from Rocket.Utils import ollama_auto_setup
+
+        detector = ollama_auto_setup.SystemDetector()
+        detector.os_type = "Linux"
+        with patch.object(ollama_auto_setup, "pynvml", None), \
+                patch("shutil.which", return_value=None), \
+                patch("subprocess.run") as mock_run:
+            assert detector._detect_nvidia_gpu() == (False, None, None, None)
+            assert detector._detect_amd_gpu() == (False, None, None, None)
+            assert detector._detect_intel_gpu() == (False, None, None, None)
+
+        mock_run.assert_not_called()
+
+    def test_windows_gpu_detection_via_dxgi(self):
+        """Test AMD/Intel detection on Windows uses DXGI instead of WMIC"""
+        from Rocket.Utils import ollama_auto_setup
+        
+        adapters = (
+            (0x8086, "Intel(R) UHD Graphics 770", 128 * 1024 ** 2),
+            (0x1002, "AMD Radeon RX 7900 XTX", 24 * 1024 ** 3),
+        )
+        
+        with patch.object(ollama_auto_setup, "_enumerate_dxgi_adapters", return_value=adapters), \
+                patch("subprocess.run") as mock_run:
+            detector = ollama_auto_setup.SystemDetector()
+            detector.os_type = "Windows"
+            amd = detector._detect_amd_gpu()
+            intel = detector._detect_intel_gpu()
+        
+        assert amd[:2] == (True, "AMD Radeon RX 7900 XTX")
+        assert abs(amd[2] - 24.0) < 0.1
+        assert intel[0] is True and intel[3] == "intel"
+        mock_run.assert_not_called()
+
+    def test_windows_gpu_detection_via_registry(self):
+        """Test the PCI registry is used before WMIC when DXGI is unavailable"""
+        from Rocket.Utils import ollama_auto_setup
+
+        devices = ((0x1002, "AMD Radeon RX 6600"),)
+
+        with patch.object(ollama_auto_setup, "_enumerate_dxgi_adapters", return_value=None), \
+                patch.object(ollama_auto_setup, "_enumerate_pci_display_devices", return_value=devices), \
+                patch("subprocess.run") as mock_run:
+            detector = ollama_auto_setup.SystemDetector()
+            detector.os_type = "Windows"
+            amd = detector._detect_amd_gpu()
+            intel = detector._detect_intel_gpu()
+
+        assert amd == (True, "AMD Radeon RX 6600", None, "amd")
+        assert intel == (False, None, None, None)
+        mock_run.assert_not_called()
+    
+    def test_gpu_detection_prefers_vendor_priority(self):
+        """Test concurrent GPU probes still return results in priority order"""
+        import time
+        from Rocket.Utils.ollama_auto_setup import SystemDetector
+        
+        def slow_nvidia():
+            time.sleep(0.2)
+            return True, "RTX 4090", 24.0, "nvidia"
+        
+        detector = SystemDetector()
+        with patch.object(detector, "_detect_nvidia_gpu", side_effect=slow_nvidia), \
+                patch.object(detector, "_detect_amd_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_apple_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_intel_gpu", return_value=(True, "Intel UHD", None, "intel")):
+            assert detector._detect_gpu()[3] == "nvidia"
+        
+        with patch.object(detector, "_detect_nvidia_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_amd_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_apple_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_intel_gpu", return_value=(True, "Intel UHD", None, "intel")):
+            assert detector._detect_gpu()[3] == "intel"
+
+    def test_gpu_probe_timeout_reported(self):
+        """Test a hung vendor tool is reported instead of read as 'no GPU'"""
+        import subprocess
+        from Rocket.Utils import ollama_auto_setup
+
+        detector = ollama_auto_setup.SystemDetector()
+        detector.os_type = "Linux"
+        hung = subprocess.TimeoutExpired(["nvidia-smi"], detector.PROBE_TIMEOUT)
+        with patch.object(ollama_auto_setup, "pynvml", None), \
+                patch("shutil.which", return_value="/usr/bin/nvidia-smi"), \
+                patch("subprocess.run", side_effect=hung):
+            with pytest.raises(subprocess.TimeoutExpired):
+                detector._detect_nvidia_gpu()
+
+        with patch.object(detector, "_detect_nvidia_gpu", side_effect=hung), \
+                patch.object(detector, "_detect_amd_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_apple_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_intel_gpu", return_value=(True, "Intel UHD", None, "intel")):
+            assert detector._detect_gpu()[3] == "intel"
+        assert detector._probe_failed is True
+
+    def test_detect_all_reuses_cached_hardware(self, tmp_path):
+        """Test CPU/GPU details are cached on disk while RAM is re-read"""
+        from Rocket.Utils.ollama_auto_setup import SystemDetector
+
+        detector = SystemDetector(cache_file=tmp_path / "system_capabilities.json")
+        with patch.object(detector, "_detect_cpu", return_value=(8, 16, "Test CPU")) as mock_cpu, \
+                patch.object(detector, "_detect_gpu", return_value=(True, "RTX 4090", 24.0, "nvidia")) as mock_gpu, \
+                patch.object(detector, "_detect_ram", side_effect=[(32.0, 20.0), (32.0, 12.0), (32.0, 10.0)]):
+            first = detector.detect_all()
+            second = detector.detect_all()
+            detector.detect_all(use_cache=False)
+
+        assert mock_cpu.call_count == 2
+        assert mock_gpu.call_count == 2
+        assert second.cpu_brand == first.cpu_brand == "Test CPU"
+        assert second.gpu_vram_gb == 24.0
+        assert (first.ram_available_gb, second.ram_available_gb) == (20.0, 12.0)
+
+    def test_detect_all_ignores_incomplete_cache(self, tmp_path):
+        """Test a cache entry with missing fields triggers re-detection"""
+        from Rocket.Utils.ollama_auto_setup import SystemDetector
+
+        cache_file = tmp_path / "system_capabilities.json"
+        detector = SystemDetector(cache_file=cache_file)
+        with patch.object(detector, "_detect_cpu", return_value=(8, 16, "Test CPU")), \
+                patch.object(detector, "_detect_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_ram", return_value=(32.0, 20.0)):
+            detector.detect_all()
+
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        del data["hardware"]["cpu_brand"]
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        with patch.object(detector, "_detect_cpu", return_value=(8, 16, "Test CPU")) as mock_cpu, \
+                patch.object(detector, "_detect_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_ram", return_value=(32.0, 20.0)):
+            caps = detector.detect_all()
+
+        mock_cpu.assert_called_once()
+        assert caps.cpu_brand == "Test CPU"
+
+    def test_detect_all_does_not_cache_timed_out_probe(self, tmp_path):
+        """Test hardware details are not cached when a GPU probe timed out"""
+        import subprocess
+        from Rocket.Utils.ollama_auto_setup import SystemDetector
+
+        cache_file = tmp_path / "system_capabilities.json"
+        detector = SystemDetector(cache_file=cache_file)
+        hung = subprocess.TimeoutExpired(["nvidia-smi"], detector.PROBE_TIMEOUT)
+        with patch.object(detector, "_detect_cpu", return_value=(8, 16, "Test CPU")), \
+                patch.object(detector, "_detect_nvidia_gpu", side_effect=hung), \
+                patch.object(detector, "_detect_amd_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_apple_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_intel_gpu", return_value=(False, None, None, None)), \
+                patch.object(detector, "_detect_ram", return_value=(32.0, 20.0)):
+            caps = detector.detect_all()
+
+        assert caps.has_gpu is False
+        assert not cache_file.exists()
+
+        with patch.object(detector, "_detect_cpu", return_value=(8, 16, "Test CPU")), \
+                patch.object(detector, "_detect_gpu", return_value=(True, "RTX 4090", 24.0, "nvidia")), \
+                patch.object(detector, "_detect_ram", return_value=(32.0, 20.0)):
+            caps = detector.detect_all()
+
+        assert caps.has_gpu is True
+        assert cache_file.exists()
+
     def test_system_capabilities_string_representation(self):
         """Test SystemCapabilities string output"""
         from Rocket.Utils.ollama_auto_setup import SystemCapabilities
@@ -232,12 +590,64 @@ class TestModelRecommendation:
         # First should be the primary recommendation
         assert fallbacks[0].model_size.value >= fallbacks[1].model_size.value
 
+    def test_recommendation_memoized_for_equal_caps(self):
+        """Test equal capabilities reuse the cached recommendation"""
+        import dataclasses
+        from Rocket.Utils.ollama_auto_setup import ModelRecommender, SystemCapabilities
+        
+        def make_caps():
+            return SystemCapabilities(
+                cpu_count_physical=4,
+                cpu_count_logical=8,
+                cpu_brand="Mid CPU",
+                ram_total_gb=16.0,
+                ram_available_gb=12.0,
+                has_gpu=False,
+                os_type="Linux",
+                architecture="x86_64"
+            )
+        
+        recommender = ModelRecommender()
+        first = recommender.recommend(make_caps())
+        assert recommender.recommend(make_caps()) is first
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.model_name = "other"
+    
+    def test_fallback_models_ordered_by_parameter_count(self):
+        """Test fallbacks compare sizes numerically (13B is larger than 3B)"""
+        from Rocket.Utils.ollama_auto_setup import (
+            ModelRecommender,
+            ModelSize,
+            SystemCapabilities
+        )
+        
+        caps = SystemCapabilities(
+            cpu_count_physical=8,
+            cpu_count_logical=16,
+            cpu_brand="High CPU",
+            ram_total_gb=32.0,
+            ram_available_gb=24.0,
+            has_gpu=False,
+            os_type="Linux",
+            architecture="x86_64"
+        )
+        
+        fallbacks = ModelRecommender().get_fallback_models(caps)
+        
+        assert [f.model_size for f in fallbacks] == [
+            ModelSize.LARGE, ModelSize.MEDIUM, ModelSize.SMALL, ModelSize.TINY
+        ]
+        assert ModelSize.TINY.label == "1.5B"
+        assert "(13B parameters)" in str(fallbacks[0])
+
 
 class TestOllamaInstaller:
     """Test Ollama installer functionality"""
     
+    @patch('shutil.which', return_value="/usr/local/bin/ollama")
     @patch('subprocess.run')
-    def test_is_ollama_installed_true(self, mock_run):
+    def test_is_ollama_installed_true(self, mock_run, mock_which):
         """Test Ollama installation check when installed"""
         from Rocket.Utils.ollama_auto_setup import OllamaInstaller
         
@@ -246,14 +656,66 @@ class TestOllamaInstaller:
         installer = OllamaInstaller()
         assert installer.is_ollama_installed() is True
     
+    @patch('shutil.which', return_value="/usr/local/bin/ollama")
     @patch('subprocess.run', side_effect=FileNotFoundError)
-    def test_is_ollama_installed_false(self, mock_run):
+    def test_is_ollama_installed_false(self, mock_run, mock_which):
         """Test Ollama installation check when not installed"""
         from Rocket.Utils.ollama_auto_setup import OllamaInstaller
         
         installer = OllamaInstaller()
         assert installer.is_ollama_installed() is False
     
+    @patch('shutil.which', return_value=None)
+    @patch('subprocess.run')
+    def test_is_ollama_installed_not_on_path(self, mock_run, mock_which):
+        """Test a missing executable is detected without spawning a process"""
+        from Rocket.Utils.ollama_auto_setup import OllamaInstaller
+        
+        installer = OllamaInstaller()
+        installer.os_type = "Linux"
+        assert installer.is_ollama_installed() is False
+        assert installer.get_ollama_path() is None
+        mock_run.assert_not_called()
+    
+    @patch('shutil.which', return_value="/usr/local/bin/ollama")
+    @patch('subprocess.Popen')
+    def test_install_model_streams_progress(self, mock_popen, mock_which, capsys):
+        """Test model pull output is parsed into a progress display"""
+        from Rocket.Utils.ollama_auto_setup import OllamaInstaller
+        
+        process = mock_popen.return_value
+        process.stdout = iter([
+            "pulling manifest\n",
+            "pulling 8eeb52dfb3bb...  10% \u2595\u2588   \u258f 0.5 GB/4.7 GB\n",
+            "pulling 8eeb52dfb3bb...  10% \u2595\u2588   \u258f 0.5 GB/4.7 GB\n",
+            "pulling 8eeb52dfb3bb... 100% \u2595\u2588\u2588\u2588\u2588\u258f 4.7 GB\n",
+            "success\n",
+        ])
+        process.returncode = 0
+        
+        installer = OllamaInstaller()
+        installer.os_type = "Linux"
+        assert installer.install_model("qwen2.5-coder:7b") is True
+        
+        output = capsys.readouterr().out
+        assert output.count(" 10%") == 1
+        assert "100%" in output
+        assert "success" in output
+    
+    def test_install_model_aborts_when_idle(self):
+        """Test a pull that stops producing output is killed"""
+        import subprocess
+        from Rocket.Utils.ollama_auto_setup import OllamaInstaller
+        
+        real_popen = subprocess.Popen
+        stalled_pull = [sys.executable, "-c", "import time; print('pulling manifest', flush=True); time.sleep(30)"]
+        
+        installer = OllamaInstaller()
+        installer.PULL_IDLE_TIMEOUT = 0.5
+        with patch.object(installer, "get_ollama_path", return_value=Path("ollama")), \
+                patch("subprocess.Popen", side_effect=lambda cmd, **kwargs: real_popen(stalled_pull, **kwargs)):
+            assert installer.install_model("qwen2.5-coder:7b") is False
+    
     @patch('subprocess.run')
     def test_list_installed_models(self, mock_run):
         """Test listing installed models"""
@@ -287,7 +749,20 @@ class TestProviderSelector:
             assert selector.config_path == config_path
             assert selector.detector is not None
             assert selector.recommender is not None
-    
+
+    def test_refresh_bypasses_hardware_cache_once(self):
+        """Test refresh re-detects hardware on the first detection only"""
+        from Rocket.Utils.smart_config import ProviderSelector
+
+        selector = ProviderSelector(refresh=True)
+        with patch.object(selector.detector, "detect_all") as mock_detect:
+            selector._detect_capabilities()
+            selector._detect_capabilities()
+
+        assert [c.kwargs for c in mock_detect.call_args_list] == [
+            {"use_cache": False}, {"use_cache": True}
+        ]
+
     def test_gemini_check_with_env_var(self):
         """Test Gemini API key detection from environment"""
         from Rocket.Utils.smart_config import ProviderSelector
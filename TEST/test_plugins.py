@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the Rocket CLI plugin system
+
+Tests:
+1. Plugin loading and hook registration
+2. Plugin unloading
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+PLUGIN_SOURCE = '''
+from Rocket.Utils.plugins import Plugin, PluginMetadata
+
+calls = []
+
+
+class CountingPlugin(Plugin):
+    get_hooks_calls = 0
+
+    @property
+    def metadata(self):
+        return PluginMetadata(name="{name}", version="1.0", author="test", description="test")
+
+    def before_command(self, context):
+        calls.append(("before_command", "{name}"))
+
+    def get_hooks(self):
+        type(self).get_hooks_calls += 1
+        return {{"before_command": self.before_command, "after_command": self.before_command}}
+'''
+
+
+def _write_plugin(plugins_dir, name):
+    """Write a plugin module that records hook calls."""
+    (plugins_dir / f"{name}.py").write_text(PLUGIN_SOURCE.format(name=name), encoding="utf-8")
+
+
+class TestPluginHooks:
+    """Test plugin hook registration"""
+
+    def test_load_and_unload_call_get_hooks_once(self, tmp_path):
+        """get_hooks() runs once per load; unload reuses the registered hooks"""
+        from Rocket.Utils.plugins import PluginManager
+
+        _write_plugin(tmp_path, "rocket_test_counting")
+        manager = PluginManager(plugins_dir=tmp_path)
+
+        assert manager.load_plugin("rocket_test_counting") is True
+        plugin = manager.get_plugin("rocket_test_counting")
+        assert manager.unload_plugin("rocket_test_counting") is True
+
+        assert type(plugin).get_hooks_calls == 1
+        assert manager._hooks["before_command"] == []
+        assert manager._hooks["after_command"] == []
+
+    def test_unload_keeps_other_plugins_hooks(self, tmp_path):
+        """Unloading one plugin leaves hooks of other plugins registered"""
+        from Rocket.Utils.plugins import PluginManager
+
+        _write_plugin(tmp_path, "rocket_test_first")
+        _write_plugin(tmp_path, "rocket_test_second")
+        manager = PluginManager(plugins_dir=tmp_path)
+        manager.load_plugin("rocket_test_first")
+        manager.load_plugin("rocket_test_second")
+
+        manager.unload_plugin("rocket_test_first")
+        manager.execute_hook("before_command", context={})
+
+        assert sys.modules["rocket_test_first"].calls == []
+        assert sys.modules["rocket_test_second"].calls == [("before_command", "rocket_test_second")]
+
+    def test_unload_matches_hooks_by_identity(self, tmp_path):
+        """An equal callable registered by another plugin is not removed"""
+        from Rocket.Utils.plugins import PluginManager
+
+        class AlwaysEqual:
+            def __call__(self, context):
+                pass
+
+            def __eq__(self, other):
+                return True
+
+            __hash__ = object.__hash__
+
+        _write_plugin(tmp_path, "rocket_test_identity")
+        manager = PluginManager(plugins_dir=tmp_path)
+        other_hook = AlwaysEqual()
+        manager._hooks["before_command"].append(other_hook)
+        manager.load_plugin("rocket_test_identity")
+
+        manager.unload_plugin("rocket_test_identity")
+
+        assert manager._hooks["before_command"] == [other_hook]
+        assert manager._hooks["before_command"][0] is other_hook
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])